@@ -1,2 +1,3 @@
 from md5files.checksums import *
 from md5files.md5file_utils import *
+from md5files.checksum_cache import *
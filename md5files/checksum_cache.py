@@ -0,0 +1,112 @@
+"""Persistent cache of calculated MD5 checksums
+
+Contains the following classes:
+    * ChecksumCache
+
+Contains the following functions:
+    * get_default_cache_path
+
+"""
+
+import os
+import sqlite3
+
+
+def get_default_cache_path() -> str:
+    """Gets filepath to the default checksum cache
+
+    The cache is stored in "checksum_archive_tools" within the user's cache
+    directory ($XDG_CACHE_HOME, or "~/.cache" if not set).
+
+    Returns:
+        str: filepath to default checksum cache (that may not exist)
+
+    """
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_dir, "checksum_archive_tools", "md5_cache.sqlite3")
+
+
+class ChecksumCache:
+    """Persistent cache of MD5 checksums for files on disk.
+
+    Checksums are keyed by absolute filepath, and a cached checksum is only
+    used while the file's size and modification time match those recorded
+    when it was checksummed. Corruption that leaves both unchanged cannot be
+    detected from a cached checksum.
+
+    """
+
+    def __init__(self, cache_path: str = None):
+        """
+        Args:
+            cache_path (str, optional): Path to file to store cache in. It
+                will be created if it does not exist. If None, uses
+                `get_default_cache_path()`. Defaults to None.
+
+        """
+        if cache_path is None:
+            cache_path = get_default_cache_path()
+
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+
+        self._cache_path = cache_path
+        self._connection = sqlite3.connect(cache_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS checksums ("
+            "filepath TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, checksum TEXT)"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def cache_path(self) -> str:
+        """str: path to file that cache is stored in"""
+        return self._cache_path
+
+    def get(self, filepath: str, stat: os.stat_result) -> str:
+        """
+        Args:
+            filepath (str): Path to file to get cached checksum of.
+            stat (os.stat_result): Current result of `os.stat(filepath)`.
+
+        Returns:
+            str: cached checksum of `filepath`, or None if it has no cached
+                checksum or its size/modification time has changed since
+
+        """
+        row = self._connection.execute(
+            "SELECT size, mtime_ns, checksum FROM checksums WHERE filepath = ?",
+            (os.path.abspath(filepath),),
+        ).fetchone()
+
+        if row is None or row[:2] != (stat.st_size, stat.st_mtime_ns):
+            return None
+
+        return row[2]
+
+    def set(self, filepath: str, stat: os.stat_result, checksum: str) -> None:
+        """
+        Args:
+            filepath (str): Path to file that was checksummed.
+            stat (os.stat_result): Result of `os.stat(filepath)` from before
+                `filepath` was checksummed.
+            checksum (str): Checksum of `filepath`.
+
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?)",
+            (os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns, checksum),
+        )
+
+    def commit(self) -> None:
+        """Saves checksums added with `set()` to the cache file"""
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Saves checksums added with `set()` and closes the cache file"""
+        self._connection.commit()
+        self._connection.close()
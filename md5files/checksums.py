@@ -10,25 +10,24 @@ Contains the following functions:
 """
 
 import os
-import unicodedata
+from collections import defaultdict
+from contextlib import nullcontext
 from tqdm import tqdm
-from natsort import natsorted
+from natsort import natsort_keygen
 from send2trash import send2trash
 
 from utils import (
     concat_filepaths,
     append_unique_lines_to_file,
-    index_if_possible,
-    make_relative_path,
+    walk_files,
+    normalise_nfc,
 )
-from md5lines import CustomMD5Line
+from md5files.checksum_cache import ChecksumCache
 from md5files.md5file_utils import (
-    md5,
+    md5_files,
     get_checksum_save_location,
-    extract_from_md5file,
+    iter_md5file,
     check_custom_md5file_header,
-    separate_by_dirs,
-    separate_by_uniqueness,
     is_checksum_filename,
     finding_missing_files,
     remove_checksums,
@@ -39,6 +38,9 @@ from md5files.md5file_utils import (
     NESTED_CHECKSUM_HEADER,
 )
 
+# key for natural sorting of filenames, built once rather than on every sort
+_natsort_key = natsort_keygen()
+
 
 def generate_checksums(
     folder_path: str,
@@ -47,6 +49,8 @@ def generate_checksums(
     unsorted_md5_format: str = "md5",
     files_to_ignore: list = None,
     files_to_ignore_filepath: str = None,
+    use_cache: bool = False,
+    use_processes: bool = False,
 ):
     """Creates MD5 checksum file for a folder
 
@@ -80,68 +84,116 @@ def generate_checksums(
             filenames (including extensions) to ignore when checksumming. Any
             file that matches a filename in the file will be skipped and not
             checksummed. Defaults to None.
+        use_cache (bool, optional): If true, files that have not changed size
+            or modification time since they were last checksummed (see
+            `ChecksumCache`) take their checksum from the cache rather than
+            calculating it again. Defaults to False.
+        use_processes (bool, optional): If true, directories with many files
+            are checksummed by a pool of processes rather than threads (see
+            `md5_files()`), which can be faster for many small files. On
+            platforms that spawn processes (Windows, macOS), the calling
+            script must be guarded by `if __name__ == "__main__":`. Defaults
+            to False.
 
     """
     save_location = get_checksum_save_location(folder_path, updating_only)
 
     # checksums will only be generated for files not recorded in save_location
-    # dirpaths_group = (dirpaths, dirpath_filenames, dirpath_checksums)
-    dirpaths_group = _get_dirpaths_group(save_location)
+    # existing_filenames_by_dir = {dirpath: set of filenames}
+    existing_filenames_by_dir = _get_existing_filenames_by_dir(save_location)
 
     # unsorted filenames/checksums will be checked before generating checksums for new files
-    # unsorted_group = (unsorted_filenames, unsorted_checksums, unsorted_dupe_filenames, unsorted_dupe_checksums)
+    # unsorted_group = ({unsorted_filename: checksum}, {unsorted_dupe_filename: {checksums}})
     unsorted_group = _get_unsorted_group(unsorted_md5_filepath, unsorted_md5_format)
 
-    # list of filenames to ignore when checksumming
-    if not files_to_ignore:
-        files_to_ignore = []
+    # set of filenames to ignore when checksumming (normalised like filenames on disk)
+    files_to_ignore = set(files_to_ignore or [])
 
     if files_to_ignore_filepath:
         with open(files_to_ignore_filepath, "r", encoding="utf8") as file:
-            files_to_ignore += [line.rstrip() for line in file.readlines()]
+            files_to_ignore.update(line.rstrip() for line in file)
+
+    files_to_ignore = frozenset(normalise_nfc(file) for file in files_to_ignore)
+
+    # lines already in save_location will not be written again
+    existing_lines = set()
+    if os.path.exists(save_location):
+        # (a byte order mark is stripped so the header is still recognised)
+        with open(save_location, "r", encoding="utf-8-sig") as file:
+            existing_lines = set(file.readlines())
 
-    lines_to_write = [MAIN_CHECKSUM_HEADER + "\n"]
     failed_checksums = []
 
-    for root, _, files in os.walk(folder_path):
-        if not files:
-            continue
-
-        root_filtered = make_relative_path(root, os.path.basename(folder_path))
-
-        # get list of filenames that can be skipped in the subdirectory being explored
-        existing_filenames = None
-        dirpaths_idx = index_if_possible(dirpaths_group[0], root_filtered)
-        if dirpaths_idx != -1:
-            existing_filenames = dirpaths_group[1][dirpaths_idx]
-
-        # generate checksums and form lines to write
-        lines_to_write_part, failed_checksums_part = _generate_checksums_subdir(
-            files,
-            root,
-            root_filtered,
-            unsorted_group,
-            existing_filenames,
-            files_to_ignore,
-        )
+    # lines are written after each subdirectory rather than all at the end
+    with open(save_location, "a", encoding="utf8", buffering=1 << 20) as save_file, (
+        ChecksumCache() if use_cache else nullcontext()
+    ) as cache:
+        if MAIN_CHECKSUM_HEADER + "\n" not in existing_lines:
+            save_file.write(MAIN_CHECKSUM_HEADER + "\n")
+
+        for root, files in walk_files(folder_path):
+            if not files:
+                continue
+
+            root_filtered = _get_relative_dirpath(root, folder_path)
+
+            # get set of filenames that can be skipped in the subdirectory being explored
+            existing_filenames = existing_filenames_by_dir.get(root_filtered)
+
+            # generate checksums and form lines to write
+            lines_to_write, failed_checksums_part = _generate_checksums_subdir(
+                files,
+                root,
+                root_filtered,
+                unsorted_group,
+                existing_filenames,
+                files_to_ignore,
+                cache,
+                use_processes,
+            )
 
-        lines_to_write += lines_to_write_part
-        failed_checksums += failed_checksums_part
+            for line in lines_to_write:
+                if line not in existing_lines:
+                    existing_lines.add(line)
+                    save_file.write(line)
+
+            failed_checksums += failed_checksums_part
+
+        # single barrier for the whole run, so saved checksums survive a crash
+        save_file.flush()
+        os.fsync(save_file.fileno())
 
-    append_unique_lines_to_file(save_location, lines_to_write)
     if failed_checksums:
         print("FAILED: due to mismatched checksums from unsorted_md5 source")
     for line in failed_checksums:
         print(f"    {line}")
 
 
+def _get_relative_dirpath(dirpath: str, folder_path: str) -> str:
+    """Part of / Helper for `generate_checksums()` and `verify_checksums()`
+
+    Returns:
+        str: `dirpath` relative to `folder_path`, in the form used for
+            filepaths in checksum files (either "." or "./subdir")
+
+    """
+    relative_dirpath = os.path.relpath(dirpath, folder_path).replace("\\", "/")
+
+    if relative_dirpath == ".":
+        return relative_dirpath
+
+    return normalise_nfc(f"./{relative_dirpath}")
+
+
 def _generate_checksums_subdir(
     files: list,
     root: str,
     root_filtered: str,
     unsorted_group: tuple,
-    existing_filenames: list = None,
-    files_to_ignore: list = None,
+    existing_filenames: set = None,
+    files_to_ignore: frozenset = None,
+    cache: ChecksumCache = None,
+    use_processes: bool = False,
 ):
     """Part of / Helper for `generate_checksums()`
 
@@ -150,123 +202,156 @@ def _generate_checksums_subdir(
         root (str): Absolute path to subdirectory.
         root_filtered (str): Relative path to subdirectory from main directory.
             being checksummed.
-        unsorted_group (tuple[list, list, list, list]): [0] Unique unsorted
-            filenames, [1] their corresponding checksums, [2] non-unique
-            unsorted filenames, [3] their corresponding checksums.
-        existing_filenames (list, optional): Filenames in subdirectory that
+        unsorted_group (tuple[dict, dict]): [0] Unique unsorted filenames
+            mapped to their checksums, [1] non-unique unsorted filenames
+            mapped to sets of their checksums.
+        existing_filenames (set, optional): Filenames in subdirectory that
             can be skipped. Defaults to None.
-        files_to_ignore (list, optional): List containing filenames (including
+        files_to_ignore (frozenset, optional): Set of filenames (including
             extensions) to ignore when checksumming. Any file that matches a
-            filename in the list will be skipped and not checksummed. Defaults
+            filename in the set will be skipped and not checksummed. Defaults
             to None.
+        cache (ChecksumCache, optional): Cache to get unchanged files'
+            checksums from, and add new checksums to. Defaults to None.
+        use_processes (bool, optional): Passed to `md5_files()`. Defaults to
+            False.
 
     Returns:
         tuple[list, list]: [0] lines_to_write from subdirectory in "custom"
         format, [1] failed_checksums from subdirectory
 
     """
-    # list of filenames to ignore when checksumming
-    if not files_to_ignore:
-        files_to_ignore = []
+    # set of filenames to ignore when checksumming
+    files_to_ignore = frozenset(files_to_ignore or [])
 
     # nested filenames/checksums will be checked before generating checksums for new files
-    nested_filenames, nested_checksums = [], []
+    nested_checksums = {}
     if NESTED_CHECKSUM_FILENAME in files:
-        nested_filenames, nested_checksums = extract_from_md5file(
-            concat_filepaths(root, NESTED_CHECKSUM_FILENAME), "custom_nested"
+        nested_checksums = dict(
+            iter_md5file(
+                concat_filepaths(root, NESTED_CHECKSUM_FILENAME), "custom_nested"
+            )
         )
 
     # unsorted filenames/checksums will be checked before generating checksums for new files
-    (
-        unsorted_filenames,
-        unsorted_checksums,
-        unsorted_dupe_filenames,
-        unsorted_dupe_checksums,
-    ) = unsorted_group
+    unsorted_checksums, unsorted_dupe_checksums = unsorted_group
 
-    lines_to_write, failed_checksums = [], []
+    # checksums of files to write lines for (None if checksum is yet to be calculated)
+    checksums = {}
+    files_to_hash = []
 
-    for file in tqdm(natsorted(files), leave=False, desc=f"{os.path.basename(root)}"):
-        file = unicodedata.normalize("NFC", file)
+    # normalise filenames once, before comparing, but open files by their name on disk
+    filenames_on_disk = {normalise_nfc(file): file for file in files}
 
-        if file in files_to_ignore or is_checksum_filename(file):
-            continue
-
-        if existing_filenames is not None and file in existing_filenames:
-            continue
+    # only sort files that need lines written (usually few when updating)
+    files = [
+        file
+        for file in filenames_on_disk
+        if file not in files_to_ignore
+        and not is_checksum_filename(file)
+        and (existing_filenames is None or file not in existing_filenames)
+    ]
 
+    for file in sorted(files, key=_natsort_key):
         # if possible, get md5 checksum of file from alternative source, else calculate checksum (expensive)
-        if file in nested_filenames:
-            checksum = nested_checksums[nested_filenames.index(file)]
-        elif file in unsorted_filenames:
-            checksum = unsorted_checksums[unsorted_filenames.index(file)]
-        elif file in unsorted_dupe_filenames:
-            tqdm.write(f"verifing checksum '{file}' - ({root_filtered})")
-            checksum = md5(root + "/" + file)
-
-            matching_filenames = [
-                unsorted_dupe_filenames[idx]
-                for idx, x in enumerate(unsorted_dupe_checksums)
-                if x == checksum
-            ]
-            if file not in matching_filenames:
+        if file in nested_checksums:
+            checksums[file] = nested_checksums[file]
+        elif file in unsorted_checksums:
+            checksums[file] = unsorted_checksums[file]
+        else:
+            checksums[file] = None
+            files_to_hash.append(file)
+
+    # calculate remaining checksums as a batch
+    failed_checksums = []
+    hashed_checksums = md5_files(
+        [root + "/" + filenames_on_disk[file] for file in files_to_hash],
+        cache=cache,
+        use_processes=use_processes,
+    )
+
+    for file, checksum in tqdm(
+        zip(files_to_hash, hashed_checksums),
+        total=len(files_to_hash),
+        leave=False,
+        desc=f"{os.path.basename(root)}",
+    ):
+        if file in unsorted_dupe_checksums:
+            if checksum not in unsorted_dupe_checksums[file]:
                 failed_checksums.append(f"'{file}' - ({root_filtered})")
                 tqdm.write(f"failed: verifing checksum '{file}'")
+                del checksums[file]
                 continue
 
             tqdm.write(f"finished verifing checksum '{file}' - ({root_filtered})")
         else:
-            tqdm.write(f"checksumming '{file}' - ({root_filtered})")
-            checksum = md5(root + "/" + file)
+            tqdm.write(f"checksummed '{file}' - ({root_filtered})")
 
-        # add custom md5 line to lines to write
-        line_path = concat_filepaths(root_filtered, file)
-        line = CustomMD5Line.get_custom_md5line_string(line_path, checksum) + "\n"
-        lines_to_write.append(line)
+        checksums[file] = checksum
+
+    # form custom md5 lines to write (format of CustomMD5Line.get_custom_md5line_string),
+    # root_filtered has no trailing slash, so filenames can be joined on without
+    # calling concat_filepaths for every file (slashes are normalised the same way)
+    line_prefix = root_filtered + "/"
+    lines_to_write = [
+        line_prefix + file.replace("\\", "/") + f" -> {checksum}\n"
+        for file, checksum in checksums.items()
+    ]
 
     return lines_to_write, failed_checksums
 
 
-def _get_dirpaths_group(save_location: str):
+def _get_existing_filenames_by_dir(save_location: str):
     """Part of / Helper for `generate_checksums()`
 
-    If `save_location` does not exist, return tuple of empty arrays
-    Else return dirpaths_group (= dirpaths, dirpath_filenames,
-        dirpath_checksums)
+    If `save_location` does not exist, return an empty dict
+    Else return a dict mapping each dirpath in `save_location` to the set of
+        filenames already recorded for it
 
     Returns:
-        tuple[list, list, list]: [0] dirpaths, [1] dirpath_filenames,
-            [2] dirpath_checksums
+        dict[str, set]: dirpaths mapped to sets of their recorded filenames
 
     """
+    existing_filenames_by_dir = {}
+
     if os.path.exists(save_location):
-        return separate_by_dirs(*extract_from_md5file(save_location, "custom"))
+        # filepaths from checksum files always use "/", so can be split directly
+        for filepath, _ in iter_md5file(save_location, "custom"):
+            dirpath, _, filename = filepath.rpartition("/")
+            existing_filenames_by_dir.setdefault(dirpath, set()).add(filename)
 
-    return [], [], []
+    return existing_filenames_by_dir
 
 
 def _get_unsorted_group(unsorted_md5_filepath: str, unsorted_md5_format: str):
     """Part of / Helper for `generate_checksums()`
 
-    If `unsorted_md5_filepath` was not specified, return tuple of empty arrays
-    Else return unsorted_group (= unsorted_filenames, unsorted_checksums,
-        unsorted_dupe_filenames, unsorted_dupe_checksums)
+    If `unsorted_md5_filepath` was not specified, return tuple of empty dicts
+    Else return unsorted_group (= unsorted_checksums, unsorted_dupe_checksums)
 
     Returns:
-        tuple[list, list, list, list]: [0] unsorted_filenames,
-            [1] unsorted_checksums, [2] unsorted_dupe_filenames,
-            [3] unsorted_dupe_checksums
+        tuple[dict, dict]: [0] unique unsorted filenames mapped to their
+            checksums, [1] non-unique unsorted filenames mapped to sets of
+            their checksums
 
     """
     if unsorted_md5_filepath is None:
-        return [], [], [], []
-
-    unsorted_filepaths, unsorted_checksums = extract_from_md5file(
-        unsorted_md5_filepath, unsorted_md5_format
-    )
-    unsorted_filenames = [os.path.basename(file) for file in unsorted_filepaths]
+        return {}, {}
+
+    # checksums_by_filename = {filename: [checksums of files with that filename]}
+    checksums_by_filename = defaultdict(list)
+    for filepath, checksum in iter_md5file(unsorted_md5_filepath, unsorted_md5_format):
+        checksums_by_filename[filepath.rpartition("/")[2]].append(checksum)
+
+    unsorted_unique_checksums = {}
+    unsorted_dupe_checksums = {}
+    for filename, checksums in checksums_by_filename.items():
+        if len(checksums) == 1:
+            unsorted_unique_checksums[filename] = checksums[0]
+        else:
+            unsorted_dupe_checksums[filename] = set(checksums)
 
-    return separate_by_uniqueness(unsorted_filenames, unsorted_checksums)
+    return unsorted_unique_checksums, unsorted_dupe_checksums
 
 
 def nest_checksums(root_folder: str, updating_only: bool):
@@ -289,35 +374,27 @@ def nest_checksums(root_folder: str, updating_only: bool):
 
     """
     main_checksum_filepath = get_checksum_save_location(root_folder, True, False)
-    filepaths, checksums = extract_from_md5file(main_checksum_filepath, "custom")
+    # lines to write for each sub directory (that contains files) in main checksum file,
+    # kept as dict keys so that lines are unique but stay in order
+    file_contents = {}
 
-    # paths of sub directories (that contains files) in main checksum file
-    unique_dirpaths = []
-    # contains an array for each filepath in unique_dirpaths, containing lines to write
-    file_contents = []
+    # filepaths from checksum files always use "/", so can be split directly
+    for filepath, checksum in iter_md5file(main_checksum_filepath, "custom"):
+        line_dirpath, _, filename = filepath.rpartition("/")
 
-    for filepath, checksum in zip(filepaths, checksums):
-        line_dirpath = os.path.dirname(filepath)
+        # format of CustomMD5Line.get_short_custom_md5line_string
+        shortened_formatted_line = f"{filename} -> {checksum}\n"
 
-        shortened_formatted_line = (
-            CustomMD5Line.get_short_custom_md5line_string(filepath, checksum) + "\n"
+        lines = file_contents.setdefault(
+            line_dirpath, {NESTED_CHECKSUM_HEADER + "\n": None}
         )
+        lines[shortened_formatted_line] = None
 
-        if line_dirpath not in unique_dirpaths:
-            unique_dirpaths.append(line_dirpath)
-            file_contents.append(
-                [NESTED_CHECKSUM_HEADER + "\n", shortened_formatted_line]
-            )
-        else:
-            idx = unique_dirpaths.index(line_dirpath)
-            if shortened_formatted_line not in file_contents[idx]:
-                file_contents[idx].append(shortened_formatted_line)
-
-    for line_dirpath, lines in zip(unique_dirpaths, file_contents):
+    for line_dirpath, lines in file_contents.items():
         filepath = get_checksum_save_location(
             concat_filepaths(root_folder, line_dirpath), updating_only, True
         )
-        append_unique_lines_to_file(filepath, lines)
+        append_unique_lines_to_file(filepath, list(lines))
 
 
 def delete_nested_checksum_files(root_folder: str):
@@ -339,21 +416,28 @@ def delete_nested_checksum_files(root_folder: str):
     """
     # TODO: add option to output mismatched_headers
     mismatched_headers = []
+    files_to_delete = []
 
-    for root, _, files in os.walk(root_folder):
+    for root, files in walk_files(root_folder):
         if NESTED_CHECKSUM_FILENAME in files:
             nested_checksum_filepath = concat_filepaths(root, NESTED_CHECKSUM_FILENAME)
             if check_custom_md5file_header(nested_checksum_filepath, True):
-                send2trash(nested_checksum_filepath)
+                files_to_delete.append(nested_checksum_filepath)
             else:  # filename matches, but header does not
                 mismatched_headers.append(nested_checksum_filepath)
 
+    # send all files to trash in one call rather than one call per file
+    if files_to_delete:
+        send2trash(files_to_delete)
+
 
 def verify_checksums(
     folder_path: str,
     use_nested_checksums: bool = False,
     follow_nested_dirs: bool = True,
     verbose: bool = True,
+    use_cache: bool = False,
+    use_processes: bool = False,
 ):
     """Verify integrity of files by comparing to their saved checksums
 
@@ -370,6 +454,18 @@ def verify_checksums(
         verbose (bool, optional): If true, outputs when there is a new file
             with no checksum saved and when a file fails verification.
             Defaults to True.
+        use_cache (bool, optional): If true, files that have not changed size
+            or modification time since they were last checksummed (see
+            `ChecksumCache`) are verified using their cached checksum instead
+            of being read again. This is faster, but cannot detect corruption
+            that leaves size and modification time unchanged. Defaults to
+            False.
+        use_processes (bool, optional): If true, directories with many files
+            are checksummed by a pool of processes rather than threads (see
+            `md5_files()`), which can be faster for many small files. On
+            platforms that spawn processes (Windows, macOS), the calling
+            script must be guarded by `if __name__ == "__main__":`. Defaults
+            to False.
 
     Returns:
         tuple[list, list, list]: lists of files that: [0] passed, [1] failed,
@@ -388,75 +484,86 @@ def verify_checksums(
                 )
             return passed, failed, new_files
 
-        checksummed_filepaths, saved_checksums = extract_from_md5file(
-            save_location, "custom"
-        )
-
-    for depth, (root, _, files) in enumerate(os.walk(folder_path)):
-        if not follow_nested_dirs and depth > 0:
-            break
+        # saved checksums keyed by filepath relative to folder_path
+        saved_checksums = {
+            filepath: checksum.upper()
+            for filepath, checksum in iter_md5file(save_location, "custom")
+        }
 
-        if not files:
-            continue
+    with ChecksumCache() if use_cache else nullcontext() as cache:
+        for depth, (root, files) in enumerate(walk_files(folder_path)):
+            if not follow_nested_dirs and depth > 0:
+                break
 
-        root_filtered = unicodedata.normalize(
-            "NFC", root.replace(folder_path, "./").replace("\\", "/").replace("//", "/")
-        )
-
-        if use_nested_checksums:
-            # get path to nested checksum file, skip whole dir if it does not exist
-            save_location = get_checksum_save_location(root, True, True)
-            if not os.path.exists(save_location):
-                new_files += [
-                    os.path.join(root_filtered, file)
-                    for file in files
-                    if not is_checksum_filename(file)
-                ]
-                if verbose:
-                    print(f"Could not find nested checksum file. Skipping '{root}'")
+            if not files:
                 continue
 
-            # convert filenames to filepaths relative to folder_path to avoid collisions
-            _filenames, saved_checksums = extract_from_md5file(
-                save_location, "custom_nested"
+            root_filtered = _get_relative_dirpath(root, folder_path)
+
+            # normalise filenames once, so they can be compared to saved filepaths,
+            # but open files by their name on disk
+            filenames_on_disk = {normalise_nfc(file): file for file in files}
+            files = sorted(filenames_on_disk, key=_natsort_key)
+
+            if use_nested_checksums:
+                # get path to nested checksum file, skip whole dir if it does not exist
+                save_location = get_checksum_save_location(root, True, True)
+                if not os.path.exists(save_location):
+                    new_files += [
+                        os.path.join(root_filtered, file)
+                        for file in files
+                        if not is_checksum_filename(file)
+                    ]
+                    if verbose:
+                        print(f"Could not find nested checksum file. Skipping '{root}'")
+                    continue
+
+                # convert filenames to filepaths relative to folder_path to avoid collisions
+                saved_checksums = {
+                    os.path.join(root_filtered, file): checksum.upper()
+                    for file, checksum in iter_md5file(save_location, "custom_nested")
+                }
+
+            # find files in this directory that have a saved checksum to verify against
+            files_to_verify = []
+
+            for file in files:
+                relative_filepath = os.path.join(root_filtered, file)
+
+                if is_checksum_filename(file):
+                    continue
+
+                if relative_filepath not in saved_checksums:  # no saved checksum, skip
+                    new_files.append(relative_filepath)
+                    if verbose:
+                        tqdm.write(
+                            f"NEW FILE, nothing to check against: '{relative_filepath}'"
+                        )
+                    continue
+
+                files_to_verify.append(file)
+
+            # verify checksums of files in this directory as a batch
+            hashed_checksums = md5_files(
+                [root + "/" + filenames_on_disk[file] for file in files_to_verify],
+                cache=cache,
+                use_processes=use_processes,
             )
-            checksummed_filepaths = [
-                os.path.join(root_filtered, file) for file in _filenames
-            ]
-
-        # verify checksum (if possible) of each file in this directory
-        for file in tqdm(
-            natsorted(files), leave=False, desc=f"{os.path.basename(root)}"
-        ):
-            file = unicodedata.normalize("NFC", file)
-            relative_filepath = os.path.join(root_filtered, file)
-
-            if is_checksum_filename(file):
-                continue
-
-            if (
-                relative_filepath not in checksummed_filepaths
-            ):  # file has no saved checksum, skip
-                new_files.append(relative_filepath)
-                if verbose:
-                    tqdm.write(
-                        f"NEW FILE, nothing to check against: '{relative_filepath}'"
-                    )
-                continue
-
-            checksum = md5(root + "/" + file)
 
-            if (
-                checksum.upper()
-                != saved_checksums[
-                    checksummed_filepaths.index(relative_filepath)
-                ].upper()
+            for file, checksum in tqdm(
+                zip(files_to_verify, hashed_checksums),
+                total=len(files_to_verify),
+                leave=False,
+                desc=f"{os.path.basename(root)}",
             ):
-                failed.append(relative_filepath)
-                if verbose:
-                    tqdm.write(f"FAILED: '{relative_filepath}'")
-            else:  # checksums match, file verified
-                passed.append(relative_filepath)
+                relative_filepath = os.path.join(root_filtered, file)
+
+                if checksum.upper() != saved_checksums[relative_filepath]:
+                    failed.append(relative_filepath)
+                    if verbose:
+                        tqdm.write(f"FAILED: '{relative_filepath}'")
+                else:  # checksums match, file verified
+                    passed.append(relative_filepath)
 
     return passed, failed, new_files
 
@@ -6,7 +6,9 @@ Contains the following functions:
     * check_custom_md5file_header
     * extract_from_md5line
     * extract_from_md5file
+    * iter_md5file
     * md5
+    * md5_files
     * revert_md5file_to_teracopy
     * find_missing_files
     * remove_checksums
@@ -16,24 +18,69 @@ Contains the following functions:
 """
 
 import os
+import codecs
 import re
+import sys
+import mmap
+import shutil
 import hashlib
-import unicodedata
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from utils import (
     clean_filepath,
-    index_if_possible,
     concat_filepaths,
+    normalise_nfc,
 )
 from md5lines import MD5Line, TeracopyMD5Line, CustomMD5Line
+from md5files.checksum_cache import ChecksumCache
 
 NESTED_CHECKSUM_FILENAME = ".nested_checksum.txt"
 MAIN_CHECKSUM_FILENAME = ".main_checksum.txt"
+CHECKSUM_FILENAMES = frozenset({MAIN_CHECKSUM_FILENAME, NESTED_CHECKSUM_FILENAME})
+
+# filenames that checksum files are renamed to when replaced
+OLD_CHECKSUM_FILENAME_PATTERN = re.compile(
+    r"^\.(main|nested)_checksum_old( \((\d+)\))?\.txt$"
+)
+OLD_MAIN_CHECKSUM_FILENAME_PATTERN = re.compile(
+    r"^\.main_checksum_old( \((\d+)\))?\.txt$"
+)
+OLD_NESTED_CHECKSUM_FILENAME_PATTERN = re.compile(
+    r"^\.nested_checksum_old( \((\d+)\))?\.txt$"
+)
 
 NESTED_CHECKSUM_HEADER = "; nested_checksum"
 MAIN_CHECKSUM_HEADER = "; main_checksum"
 
-accepted_format_types = ["md5", "custom", "custom_nested", "teracopy"]
+# number of bytes read from a file at a time when calculating its checksum
+MD5_READ_SIZE = 128 * 1024
+# files of at least this many bytes are memory-mapped to calculate their checksum
+MD5_MMAP_SIZE = 256 * 1024
+# files larger than this are read instead, as they may not fit in the address space
+MD5_MMAP_MAX_SIZE = sys.maxsize // 2
+# batches of fewer files than this are not worth starting a process pool for
+MD5_PROCESS_POOL_MIN_FILES = 256
+# number of files sent to a worker process at a time
+MD5_PROCESS_POOL_CHUNKSIZE = 64
+
+# lines in MD5 files starting with any of these are headers, not checksums
+# ("ï»¿" is a byte order mark that was decoded as Latin-1 and saved again)
+SKIPPED_LINE_PREFIXES = (";", "ï»¿")
+
+# buffers reused by `md5()` between files, one per thread
+_read_buffers = threading.local()
+
+# MD5Line class used to parse lines of each accepted format_type
+MD5LINE_CLASSES_BY_FORMAT_TYPE = {
+    "md5": MD5Line,
+    "custom": CustomMD5Line,
+    "custom_nested": CustomMD5Line,
+    "teracopy": TeracopyMD5Line,
+}
+accepted_format_types = list(MD5LINE_CLASSES_BY_FORMAT_TYPE)
 
 
 def is_checksum_filename(
@@ -55,26 +102,18 @@ def is_checksum_filename(
             `checksum_type`, False otherwise
 
     """
-    match = False
-
     if checksum_type == "custom_nested":
-        if incl_old:
-            pattern = r"^\.nested_checksum_old( (\d+))?\.txt$"
-            match = re.match(pattern, s)
-
-        return s == NESTED_CHECKSUM_FILENAME or bool(match)
+        return s == NESTED_CHECKSUM_FILENAME or (
+            incl_old and bool(OLD_NESTED_CHECKSUM_FILENAME_PATTERN.match(s))
+        )
     elif checksum_type == "custom":
-        if incl_old:
-            pattern = r"^\.main_checksum_old( (\d+))?\.txt$"
-            match = re.match(pattern, s)
-
-        return s == MAIN_CHECKSUM_FILENAME or bool(match)
-
-    if incl_old:
-        pattern = r"^\.(main|nested)_checksum_old( (\d+))?\.txt$"
-        match = re.match(pattern, s)
+        return s == MAIN_CHECKSUM_FILENAME or (
+            incl_old and bool(OLD_MAIN_CHECKSUM_FILENAME_PATTERN.match(s))
+        )
 
-    return s == MAIN_CHECKSUM_FILENAME or s == NESTED_CHECKSUM_FILENAME or bool(match)
+    return s in CHECKSUM_FILENAMES or (
+        incl_old and bool(OLD_CHECKSUM_FILENAME_PATTERN.match(s))
+    )
 
 
 def get_checksum_save_location(
@@ -121,17 +160,36 @@ def get_checksum_save_location(
                 save_location_split[0] + "_old ({})" + save_location_split[1]
             )
 
-            # iterate count until filename does not exist
-            count = 1
-            while os.path.exists(old_save_location):
-                old_save_location = old_save_location_template.format(count)
-                count += 1
+            if os.path.exists(old_save_location):
+                old_save_location = _get_unused_filepath(old_save_location_template)
 
             os.rename(save_location, old_save_location)
 
     return save_location
 
 
+def _get_unused_filepath(filepath_template: str) -> str:
+    """Part of / Helper for `get_checksum_save_location()`
+
+    Returns `filepath_template` formatted with the lowest count (from 1) that
+    does not name an existing file, listing its directory once rather than
+    checking each count for existence. Names are compared case-insensitively,
+    in case the filesystem is.
+
+    """
+    dirpath = os.path.dirname(filepath_template)
+    existing_filenames = {filename.casefold() for filename in os.listdir(dirpath)}
+
+    # iterate count until filename does not exist
+    count = 1
+    filepath = filepath_template.format(count)
+    while os.path.basename(filepath).casefold() in existing_filenames:
+        count += 1
+        filepath = filepath_template.format(count)
+
+    return filepath
+
+
 def check_custom_md5file_header(filepath: str, nested: bool) -> bool:
     """Checks file at `filepath` contains correct header
 
@@ -147,15 +205,20 @@ def check_custom_md5file_header(filepath: str, nested: bool) -> bool:
         bool: True if file at `filepath` contains expected header, False otherwise
 
     """
-    with open(filepath, "r", encoding="utf-8") as file:
-        header = file.readline().replace("\n", "")
-
     correct_header = NESTED_CHECKSUM_HEADER if nested else MAIN_CHECKSUM_HEADER
+    correct_header = correct_header.encode("utf-8")
 
-    if header != correct_header:
+    # only the start of the file is needed, so compare bytes rather than decoding a line
+    with open(filepath, "rb") as file:
+        start = file.read(len(codecs.BOM_UTF8) + len(correct_header) + 1)
+
+    start = start.removeprefix(codecs.BOM_UTF8)
+
+    if not start.startswith(correct_header):
         return False
 
-    return True
+    # header must be the whole first line
+    return start[len(correct_header) : len(correct_header) + 1] in (b"", b"\n", b"\r")
 
 
 def extract_from_md5line(md5_line: str, format_type: str = "md5") -> tuple[str, str]:
@@ -174,24 +237,31 @@ def extract_from_md5line(md5_line: str, format_type: str = "md5") -> tuple[str,
         tuple[str, str]: [filepath, checksum] extracted from `md5_line`
 
     """
-    # validates format_type arg
-    if format_type.lower() not in accepted_format_types:
-        raise ValueError(f"format_type: invalid type: '{format_type}'")
+    # validates format_type arg, and decides which implementation of
+    # extract_filepath/extract_checksum method to use
+    md5line_class = _get_md5line_class(format_type)
 
-    md5_line = unicodedata.normalize("NFC", md5_line)
+    md5_line = normalise_nfc(md5_line)
 
-    # decide which implementation of extract_filepath/extract_checksum method to use
-    format_type = format_type.lower()
-    if format_type == "md5":
-        return MD5Line.extract_filepath(md5_line), MD5Line.extract_checksum(md5_line)
-    elif format_type == "custom" or format_type == "custom_nested":
-        return CustomMD5Line.extract_filepath(md5_line), CustomMD5Line.extract_checksum(
-            md5_line
-        )
-    elif format_type == "teracopy":
-        return TeracopyMD5Line.extract_filepath(
-            md5_line
-        ), TeracopyMD5Line.extract_checksum(md5_line)
+    return md5line_class.extract_filepath_and_checksum(md5_line)
+
+
+def _get_md5line_class(format_type: str):
+    """Part of / Helper for `extract_from_md5line()` and `iter_md5file()`
+
+    Raises:
+        ValueError: Invalid `format_type` (must be one of accepted values)
+
+    Returns:
+        type: MD5Line class for lines of `format_type`
+
+    """
+    md5line_class = MD5LINE_CLASSES_BY_FORMAT_TYPE.get(format_type.lower())
+
+    if md5line_class is None:
+        raise ValueError(f"format_type: invalid type: '{format_type}'")
+
+    return md5line_class
 
 
 def extract_from_md5file(
@@ -215,49 +285,71 @@ def extract_from_md5file(
             in tuple)
 
     """
-    # validates format_type arg
-    if format_type.lower() not in accepted_format_types:
-        raise ValueError(f"format_type: invalid type: '{format_type}'")
+    # store extracted filepaths and checksums in corresponding order
+    filepaths, checksums = [], []
+    for filepath, checksum in iter_md5file(md5_filepath, format_type):
+        filepaths.append(filepath)
+        checksums.append(checksum)
 
-    # validates md5_filepath arg
-    with open(md5_filepath, "r", encoding="utf-8") as md5_file:
-        md5_lines = md5_file.readlines()
+    return filepaths, checksums
 
-    # decide which version of overridden extract_filepath/extract_checksum method to use
-    if format_type == "md5":
-        extract_filepath = MD5Line.extract_filepath
-        extract_checksum = MD5Line.extract_checksum
-    elif format_type == "custom":
-        if not check_custom_md5file_header(md5_filepath, False):
-            raise ValueError(
-                f"'{md5_filepath}' does not contain header for format_type 'custom'"
-            )
-        extract_filepath = CustomMD5Line.extract_filepath
-        extract_checksum = CustomMD5Line.extract_checksum
-    elif format_type == "custom_nested":
-        if not check_custom_md5file_header(md5_filepath, True):
+
+def iter_md5file(md5_filepath: str, format_type: str = "md5"):
+    """Gets filepaths and checksums from a MD5 checksum file, one line at a time
+
+    Unlike `extract_from_md5file()`, lines are read as they are needed rather
+    than all at once, so large checksum files are never held in memory.
+
+    Args:
+        md5_filepath (str): Path to file containing filepaths and checksums.
+        format_type (str, optional): Format style of `md5_filepath`. Accepted
+            values: "md5", "custom", "custom_nested", "teracopy". Defaults to
+            "md5".
+
+    Raises:
+        ValueError: Invalid `format_type` (must be one of accepted values)
+        ValueError: `md5_filepath` does not contain expected header
+
+    Returns:
+        Iterator[tuple[str, str]]: (filepath, checksum) for each line of
+            `md5_filepath` in order
+
+    """
+    # validates format_type arg, and decides which version of overridden
+    # extract_filepath/extract_checksum method to use
+    md5line_class = _get_md5line_class(format_type)
+
+    format_type = format_type.lower()
+    if format_type == "custom" or format_type == "custom_nested":
+        if not check_custom_md5file_header(
+            md5_filepath, format_type == "custom_nested"
+        ):
             raise ValueError(
-                f"'{md5_filepath}' does not contain header for format_type 'custom_nested'"
+                f"'{md5_filepath}' does not contain header for format_type '{format_type}'"
             )
-        extract_filepath = CustomMD5Line.extract_filepath
-        extract_checksum = CustomMD5Line.extract_checksum
-    elif format_type == "teracopy":
-        extract_filepath = TeracopyMD5Line.extract_filepath
-        extract_checksum = TeracopyMD5Line.extract_checksum
 
-    # store extracted filepaths and checksums in corresponding order
-    filepaths, checksums = [], []
-    for line in md5_lines:
-        line = unicodedata.normalize("NFC", line)
+    # validates md5_filepath arg (before first line is needed),
+    # "utf-8-sig" removes a byte order mark if the file has one
+    md5_file = open(md5_filepath, "r", encoding="utf-8-sig")
 
-        # skip/ignore header lines
-        if line[0] == "ï" or line[0] == ";" or line == "\n":
-            continue
+    return _iter_md5lines(md5_file, md5line_class.extract_filepath_and_checksum)
 
-        filepaths.append(extract_filepath(line))
-        checksums.append(extract_checksum(line))
 
-    return filepaths, checksums
+def _iter_md5lines(md5_file, extract_filepath_and_checksum):
+    """Part of / Helper for `iter_md5file()`
+
+    Yields (filepath, checksum) for each line in `md5_file`, then closes it.
+
+    """
+    with md5_file:
+        for line in md5_file:
+            # skip/ignore header and blank lines (before normalising, as they are discarded)
+            if line.startswith(SKIPPED_LINE_PREFIXES) or line.isspace():
+                continue
+
+            line = normalise_nfc(line)
+
+            yield extract_filepath_and_checksum(line)
 
 
 def md5(filepath: str) -> str:
@@ -270,13 +362,159 @@ def md5(filepath: str) -> str:
         str: hex string representation of MD5 checksum of `filepath`
 
     """
-    md5_hash = hashlib.md5()
-    with open(filepath, "rb") as file:
-        for chunk in iter(lambda: file.read(4096), b""):
-            md5_hash.update(chunk)
+    with open(filepath, "rb", buffering=0, opener=_open_without_atime) as file:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        # large files are memory-mapped and hashed in a single update
+        if MD5_MMAP_SIZE <= os.fstat(file.fileno()).st_size <= MD5_MMAP_MAX_SIZE:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except OSError:  # e.g. filesystem does not support mmap, read instead
+                mapped = None
+
+            if mapped is not None:
+                with mapped:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+                    return hashlib.md5(mapped).hexdigest()
+
+        # Python 3.11+ can run the whole read/update loop in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(file, "md5").hexdigest()
+
+        md5_hash = hashlib.md5()
+
+        # reuse one buffer for every read, file is unbuffered since reads are large
+        view = _get_read_buffer()
+
+        while size := file.readinto(view):
+            md5_hash.update(view[:size])
+
     return md5_hash.hexdigest()
 
 
+def _get_read_buffer() -> memoryview:
+    """Part of / Helper for `md5()`
+
+    Returns a buffer of `MD5_READ_SIZE` bytes to read files into. Each thread
+    keeps its own buffer, so files checksummed concurrently do not share one,
+    but a new buffer is not allocated for every file.
+
+    """
+    view = getattr(_read_buffers, "view", None)
+
+    if view is None or len(view) != MD5_READ_SIZE:
+        view = _read_buffers.view = memoryview(bytearray(MD5_READ_SIZE))
+
+    return view
+
+
+def _open_without_atime(filepath: str, flags: int) -> int:
+    """Part of / Helper for `md5()`
+
+    Opens `filepath` without updating its access time where possible, so
+    reading files to checksum them does not also write to their metadata.
+    O_NOATIME is Linux only, and only permitted for the file's owner.
+
+    Returns:
+        int: file descriptor of opened `filepath`
+
+    """
+    if hasattr(os, "O_NOATIME"):
+        try:
+            return os.open(filepath, flags | os.O_NOATIME)
+        except PermissionError:
+            pass
+
+    return os.open(filepath, flags)
+
+
+def md5_files(
+    filepaths: list,
+    max_workers: int = None,
+    cache: ChecksumCache = None,
+    use_processes: bool = False,
+):
+    """Calculates MD5 checksums for a batch of files
+
+    Files are checksummed concurrently by a pool of threads (hashlib releases
+    the GIL whilst hashing), but checksums are still yielded in the same
+    order as `filepaths`.
+
+    Args:
+        filepaths (list): Paths to files to be checksummed.
+        max_workers (int, optional): Maximum number of files to checksum at
+            once. If None, uses 4 per CPU (up to 32) for threads, or 1 per
+            CPU for processes. Defaults to None.
+        cache (ChecksumCache, optional): If specified, files that have not
+            changed size or modification time since they were cached are not
+            checksummed again, and new checksums are added to `cache`.
+            Defaults to None.
+        use_processes (bool, optional): If true, files are checksummed by a
+            pool of processes instead, which can be faster for many small
+            files (where per-file overhead, rather than hashing, holds the
+            GIL). Ignored for batches smaller than `MD5_PROCESS_POOL_MIN_FILES`.
+            Defaults to False.
+
+    Yields:
+        str: hex string representation of MD5 checksum of each file in
+            `filepaths`
+
+    """
+    if cache is None:
+        yield from _map_md5(filepaths, max_workers, use_processes)
+        return
+
+    # stat before checksumming, so a file modified meanwhile is not cached as unchanged
+    stats = [os.stat(filepath) for filepath in filepaths]
+    cached_checksums = [
+        cache.get(filepath, stat) for filepath, stat in zip(filepaths, stats)
+    ]
+    filepaths_to_hash = [
+        filepath
+        for filepath, checksum in zip(filepaths, cached_checksums)
+        if checksum is None
+    ]
+
+    hashed_checksums = _map_md5(filepaths_to_hash, max_workers, use_processes)
+
+    for filepath, stat, checksum in zip(filepaths, stats, cached_checksums):
+        if checksum is None:
+            checksum = next(hashed_checksums)
+            cache.set(filepath, stat, checksum)
+
+        yield checksum
+
+    cache.commit()
+
+
+def _map_md5(filepaths: list, max_workers: int = None, use_processes: bool = False):
+    """Part of / Helper for `md5_files()`
+
+    Yields MD5 checksums of `filepaths` in order, calculated by a pool of
+    threads, or processes if `use_processes` and the batch is large enough.
+
+    """
+    # a pool cannot checksum a single file any faster, so skip starting one
+    if len(filepaths) < 2 or max_workers == 1:
+        yield from map(md5, filepaths)
+        return
+
+    if use_processes and len(filepaths) >= MD5_PROCESS_POOL_MIN_FILES:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        chunksize = MD5_PROCESS_POOL_CHUNKSIZE
+    else:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        chunksize = 1
+
+    with executor:
+        yield from executor.map(md5, filepaths, chunksize=chunksize)
+
+
 def revert_md5file_to_teracopy_format(
     path_to_formatted_file: str, save_filepath: str
 ) -> None:
@@ -297,35 +535,83 @@ def revert_md5file_to_teracopy_format(
         write_file.write("; teracopy.com\n\n")
 
         # create and write Teracopy MD5 line for each filepath/checksum pair
-        for filepath, checksum in zip(filepaths, checksums):
-            write_file.write(
-                TeracopyMD5Line.get_teracopy_md5line_string(filepath, checksum) + "\n"
-            )
+        write_file.writelines(
+            TeracopyMD5Line.get_teracopy_md5line_string(filepath, checksum) + "\n"
+            for filepath, checksum in zip(filepaths, checksums)
+        )
 
 
-def finding_missing_files(folder_path: str, md5_filepath: str) -> list:
+def finding_missing_files(
+    folder_path: str, md5_filepath: str, max_workers: int = None
+) -> list:
     """Finds filepaths in "custom" checksum file that do not exist
 
+    Filepaths are first looked up in the listings of their directories.
+    Only filepaths not found there are checked with `os.path.exists`, so
+    names that differ in case from those on disk still count as existing
+    on case-insensitive filesystems (e.g. macOS).
+
     Args:
         folder_path (str): Path to folder where files in `md5_filepath` were
             checksummed (checksum filepaths are relative to this folder). This
             is the location where existence of files will be checked.
         md5_filepath (str): Path to checksum file in "custom" format.
+        max_workers (int, optional): Maximum number of directories to list at
+            once, which hides latency on network filesystems. If None, uses
+            the `ThreadPoolExecutor` default. Defaults to None.
 
     Returns:
         list: list of filepaths that do not exist
 
     """
-    filepaths, _ = extract_from_md5file(md5_filepath, "custom")
+    filepaths = [filepath for filepath, _ in iter_md5file(md5_filepath, "custom")]
+
+    # list each directory in `md5_filepath` once, rather than checking each file exists
+    # (filepaths from checksum files always use "/", so can be split directly)
+    dirpaths = list(
+        dict.fromkeys(filepath.rpartition("/")[0] for filepath in filepaths)
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dir_filenames = executor.map(
+            _listdir_if_possible,
+            [
+                concat_filepaths(folder_path, dirpath) if dirpath else folder_path
+                for dirpath in dirpaths
+            ],
+        )
+
+        # names on disk are normalised to match filepaths from `md5_filepath`
+        existing_filepaths = {
+            (
+                f"{dirpath}/{normalise_nfc(filename)}"
+                if dirpath
+                else normalise_nfc(filename)
+            )
+            for dirpath, filenames in zip(dirpaths, dir_filenames)
+            for filename in filenames
+        }
 
-    missing_files = []
+    # names not listed exactly may still exist on case-insensitive filesystems (e.g. macOS)
+    return [
+        filepath
+        for filepath in filepaths
+        if filepath not in existing_filepaths
+        and not os.path.exists(concat_filepaths(folder_path, filepath))
+    ]
 
-    for filepath in filepaths:
-        full_path = concat_filepaths(folder_path, filepath)
-        if not os.path.exists(full_path):
-            missing_files.append(filepath)
 
-    return missing_files
+def _listdir_if_possible(dirpath: str) -> list:
+    """Part of / Helper for `finding_missing_files()`
+
+    Returns names of entries in `dirpath`, or an empty list if it does not
+    exist (or cannot be read).
+
+    """
+    try:
+        return os.listdir(dirpath)
+    except OSError:
+        return []
 
 
 def remove_checksums(
@@ -358,50 +644,59 @@ def remove_checksums(
             and list of the removed lines
 
     """
-    # convert to set for faster search
-    filepaths = set(filepaths)
-
-    # read all lines from md5_filepath
-    with open(md5_filepath, "r", encoding="utf8") as file:
-        lines = file.readlines()
+    # convert to set for faster search (normalised like lines in md5_filepath)
+    filepaths = {normalise_nfc(filepath) for filepath in filepaths}
 
     # check md5_filepath is in "custom" format
-    try:
-        lines.remove(MAIN_CHECKSUM_HEADER + "\n")
-    except ValueError as exc:
+    if not check_custom_md5file_header(md5_filepath, False):
         raise ValueError(
             f"'{md5_filepath}' does not contain header for format_type 'custom'"
-        ) from exc
+        )
 
-    # sort lines to keep and lines to remove into two lists
-    lines_to_write = [MAIN_CHECKSUM_HEADER + "\n"]
+    save_path = os.path.split(clean_filepath(md5_filepath))[0]
     removed_lines = []
 
-    for line in lines:
-        filepath, _ = extract_from_md5line(line, "custom")
+    # lines to keep are written to a temporary file as they are read, which then
+    # replaces the checksum file once every line has been sorted
+    temp_file = tempfile.NamedTemporaryFile(
+        "w", encoding="utf8", dir=save_path, prefix=".", suffix=".tmp", delete=False
+    )
 
-        # check whether to remove line
-        if filepath in filepaths:
-            removing = ""
-            if not require_confirmation:
-                removing = "y"
+    # temporary file is removed if anything fails before it replaces the checksum file
+    try:
+        with temp_file, open(md5_filepath, "r", encoding="utf-8-sig") as file:
+            temp_file.write(MAIN_CHECKSUM_HEADER + "\n")
 
-            while removing not in ["y", "n"]:
-                removing = input(f"Remove '{line}'? [y/n]: ").lower()
+            for line in file:
+                # skip/ignore header and blank lines
+                if line.startswith(SKIPPED_LINE_PREFIXES) or line.isspace():
+                    continue
 
-            if removing.lower() == "y":
-                removed_lines.append(line)
-            else:
-                lines_to_write.append(line)
-        else:
-            lines_to_write.append(line)
+                filepath, _ = extract_from_md5line(line, "custom")
 
-    # write to file
-    save_path = os.path.split(clean_filepath(md5_filepath))[0]
-    save_location = get_checksum_save_location(save_path, not save_orig)
+                # check whether to remove line
+                if filepath in filepaths:
+                    removing = ""
+                    if not require_confirmation:
+                        removing = "y"
+
+                    while removing not in ["y", "n"]:
+                        removing = input(f"Remove '{line}'? [y/n]: ").lower()
+
+                    if removing.lower() == "y":
+                        removed_lines.append(line)
+                        continue
+
+                temp_file.write(line)
 
-    with open(save_location, "w", encoding="utf8") as file:
-        file.writelines(lines_to_write)
+        # write to file (original is renamed first if save_orig), keeping its permissions
+        shutil.copymode(md5_filepath, temp_file.name)
+        save_location = get_checksum_save_location(save_path, not save_orig)
+        os.replace(temp_file.name, save_location)
+    except BaseException:
+        temp_file.close()
+        os.remove(temp_file.name)
+        raise
 
     return save_location, removed_lines
 
@@ -424,29 +719,23 @@ def separate_by_dirs(filepaths: list, checksums: list):
             [2] their corresponding checksums
 
     """
-    # paths of parent directories of files in filepaths
-    dirpaths = []
-    # contains an array of filenames/checksums for each path in dirpaths
-    dirpath_filenames = []
-    dirpath_checksums = []
+    # {parent directory: {filename: checksum}}, in order of first occurrence
+    checksums_by_dir = {}
 
     for filepath, checksum in zip(filepaths, checksums):
         line_dirpath, filename = os.path.split(filepath)
 
-        idx = index_if_possible(dirpaths, line_dirpath)
-        if idx == -1:  # new parent directory
-            dirpaths.append(line_dirpath)
-            dirpath_filenames.append([filename])
-            dirpath_checksums.append([checksum])
-        else:  # parent directory already in dirpaths
-            y = index_if_possible(dirpath_filenames, filename)
-            if y == -1:  # new filename in dirpath
-                dirpath_filenames[idx].append(filename)
-                dirpath_checksums[idx].append(checksum)
-            elif checksum != dirpath_checksums[y]:
-                raise ValueError(
-                    "filepaths: contains identical filepaths with different checksums"
-                )
+        dir_checksums = checksums_by_dir.setdefault(line_dirpath, {})
+        existing_checksum = dir_checksums.setdefault(filename, checksum)
+
+        if existing_checksum != checksum:
+            raise ValueError(
+                "filepaths: contains identical filepaths with different checksums"
+            )
+
+    dirpaths = list(checksums_by_dir)
+    dirpath_filenames = [list(files) for files in checksums_by_dir.values()]
+    dirpath_checksums = [list(files.values()) for files in checksums_by_dir.values()]
 
     return dirpaths, dirpath_filenames, dirpath_checksums
 
@@ -462,28 +751,19 @@ def separate_by_uniqueness(filenames: list, checksums: list):
     Returns:
         tuple[list, list, list, list]: lists for: [0] unique filenames,
             [1] their corresponding checksums, [2] non-unique filenames,
-            [3] their corresponding checksums
+            [3] their corresponding checksums (each in the order given)
 
     """
+    filename_counts = Counter(filenames)
+
     unique_filenames, unique_checksums = [], []
     non_unique_filenames, non_unique_checksums = [], []
 
     for filename, checksum in zip(filenames, checksums):
-        dupe_idx = index_if_possible(non_unique_filenames, filename)
-
-        if dupe_idx == -1:  # filename is not a duplicate of a non-unique filename
-            idx = index_if_possible(unique_filenames, filename)
-
-            if idx == -1:  # filename is not a duplicate a previously unique filename
-                unique_filenames.append(filename)
-                unique_checksums.append(checksum)
-            else:  # filename is a duplicate of a previously unique filename
-                non_unique_filenames.append(unique_filenames.pop(idx))
-                non_unique_checksums.append(unique_checksums.pop(idx))
-                non_unique_filenames.append(filename)
-                non_unique_checksums.append(checksum)
-
-        else:  # filename is a duplicate of a non-unique filename
+        if filename_counts[filename] == 1:
+            unique_filenames.append(filename)
+            unique_checksums.append(checksum)
+        else:
             non_unique_filenames.append(filename)
             non_unique_checksums.append(checksum)
 
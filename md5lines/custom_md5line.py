@@ -1,5 +1,4 @@
 import os
-import re
 
 import utils
 from md5lines import MD5Line
@@ -12,6 +11,8 @@ class CustomMD5Line(MD5Line):
 
     """
 
+    __slots__ = ("_orig_custom_md5_line", "_custom_md5_line_reroot_dir")
+
     def __init__(self, custom_md5_line: str, reroot_dir: str = None):
         """
         Args:
@@ -25,16 +26,13 @@ class CustomMD5Line(MD5Line):
             ValueError: If `custom_md5_line` is not in expected format
 
         """
-        if not CustomMD5Line.validate_md5line(custom_md5_line):
-            raise ValueError("custom_md5_line: format should be 'filepath -> checksum'")
-
         self._orig_custom_md5_line = MD5Line.clean_md5line(custom_md5_line)
         self._custom_md5_line_reroot_dir = reroot_dir
 
-        checksum = CustomMD5Line.extract_checksum(custom_md5_line)
-        filepath = CustomMD5Line.extract_filepath(custom_md5_line, reroot_dir)
-        md5_line = MD5Line.get_md5line_string(filepath, checksum)
-        super().__init__(md5_line)
+        filepath, checksum = CustomMD5Line._split_cleaned_md5line(
+            self._orig_custom_md5_line, reroot_dir
+        )
+        self._set_md5line_fields(filepath, checksum)
 
     def get_string(self, short_format: bool = False) -> str:
         """
@@ -64,7 +62,9 @@ class CustomMD5Line(MD5Line):
     def validate_md5line(md5_line: str) -> bool:
         """checks that `md5_line` is formatted correctly to be a custom_md5line"""
         ## only checks string contains a md5 checksum in the right place
-        if re.match("^[A-Fa-f0-9]{32}$", MD5Line.clean_md5line(md5_line).rsplit(" -> ", 1)[1]):
+        if MD5Line.CHECKSUM_PATTERN.fullmatch(
+            MD5Line.clean_md5line(md5_line).rsplit(" -> ", 1)[1]
+        ):
             return True
 
         return False
@@ -84,6 +84,27 @@ class CustomMD5Line(MD5Line):
         filepath = MD5Line.clean_md5line(custom_md5_line).rsplit(" -> ", 1)[0]
         return utils.make_relative_path(filepath, reroot_dir)
 
+    @staticmethod
+    def extract_filepath_and_checksum(
+        custom_md5_line: str, reroot_dir: str = None
+    ) -> tuple[str, str]:
+        """same as `extract_filepath` and `extract_checksum`, but only parses `custom_md5_line` once"""
+        return CustomMD5Line._split_cleaned_md5line(
+            MD5Line.clean_md5line(custom_md5_line), reroot_dir
+        )
+
+    @staticmethod
+    def _split_cleaned_md5line(
+        cleaned_md5_line: str, reroot_dir: str = None
+    ) -> tuple[str, str]:
+        """same as `extract_filepath_and_checksum`, for a line already passed through `clean_md5line`"""
+        filepath, separator, checksum = cleaned_md5_line.rpartition(" -> ")
+
+        if not separator or not MD5Line.CHECKSUM_PATTERN.fullmatch(checksum):
+            raise ValueError("custom_md5_line: format should be 'filepath -> checksum'")
+
+        return utils.make_relative_path(filepath, reroot_dir), checksum
+
     @staticmethod
     def get_custom_md5line_string(filepath: str, checksum: str) -> str:
         return f"{filepath} -> {checksum}"
@@ -11,6 +11,17 @@ class MD5Line:
 
     """
 
+    __slots__ = (
+        "_orig_md5_line",
+        "_md5_line_reroot_dir",
+        "_filepath",
+        "_checksum",
+        "_md5_line",
+    )
+
+    # pattern that a MD5 checksum (hex string) matches
+    CHECKSUM_PATTERN = re.compile("[A-Fa-f0-9]{32}")
+
     def __init__(self, md5_line: str, reroot_dir: str = None):
         """
         Args:
@@ -23,22 +34,36 @@ class MD5Line:
             ValueError: If `md5_line` is not in expected format
 
         """
-        if not MD5Line.validate_md5line(md5_line):
-            raise ValueError("md5_line: format should be 'checksum filepath'")
-
-        self._orig_md5_line = MD5Line.clean_md5line(md5_line)
+        cleaned_md5_line = MD5Line.clean_md5line(md5_line)
+        filepath, checksum = MD5Line._split_cleaned_md5line(
+            cleaned_md5_line, reroot_dir
+        )
+        self._set_md5line_fields(filepath, checksum, cleaned_md5_line, reroot_dir)
+
+    def _set_md5line_fields(
+        self,
+        filepath: str,
+        checksum: str,
+        orig_md5_line: str = None,
+        reroot_dir: str = None,
+    ) -> None:
+        """sets attributes from an already parsed line, so subclasses do not need to form and parse a md5_line"""
+        self._filepath = filepath
+        self._checksum = checksum
+        self._md5_line = None  # formed when first accessed
+
+        # None for subclasses, as their original line is in a different format (see `orig_md5_line`)
+        self._orig_md5_line = orig_md5_line
         self._md5_line_reroot_dir = reroot_dir
 
-        self._checksum = MD5Line.extract_checksum(md5_line)
-        self._filepath = MD5Line.extract_filepath(md5_line, reroot_dir)
-        self._md5_line = MD5Line.get_md5line_string(self.filepath, self.checksum)
-
     def get_string(self) -> str:
         return self.md5_line
 
     @property
     def orig_md5_line(self) -> str:
         """str: original MD5 line used in initialisation"""
+        if self._orig_md5_line is None:
+            return self.md5_line
         return self._orig_md5_line
 
     @property
@@ -57,13 +82,17 @@ class MD5Line:
     # allows subclasses that represent MD5 lines in a different format to easily get the equivalent line in this format
     @property
     def md5_line(self) -> str:
+        if self._md5_line is None:
+            self._md5_line = MD5Line.get_md5line_string(self.filepath, self.checksum)
         return self._md5_line
 
     @staticmethod
     def validate_md5line(md5_line: str) -> bool:
         """checks that `md5_line` is formatted correctly to be a md5line"""
         ## only checks first part of the string is a md5 checksum, assumes second part is a filepath
-        if re.match("^[A-Fa-f0-9]{32}$", MD5Line.clean_md5line(md5_line).split()[0]):
+        if MD5Line.CHECKSUM_PATTERN.fullmatch(
+            MD5Line.clean_md5line(md5_line).split()[0]
+        ):
             return True
 
         return False
@@ -75,18 +104,43 @@ class MD5Line:
 
     @staticmethod
     def extract_checksum(md5_line: str) -> str:
-        if not MD5Line.validate_md5line(md5_line):
-            raise ValueError("md5_line: format should be 'checksum filepath'")
-
-        return MD5Line.clean_md5line(md5_line).split(" ./")[0]
+        return MD5Line.extract_filepath_and_checksum(md5_line)[1]
 
     @staticmethod
     def extract_filepath(md5_line: str, reroot_dir: str = None) -> str:
-        if not MD5Line.validate_md5line(md5_line):
+        return MD5Line.extract_filepath_and_checksum(md5_line, reroot_dir)[0]
+
+    @staticmethod
+    def extract_filepath_and_checksum(
+        md5_line: str, reroot_dir: str = None
+    ) -> tuple[str, str]:
+        """same as `extract_filepath` and `extract_checksum`, but only parses `md5_line` once"""
+        return MD5Line._split_cleaned_md5line(
+            MD5Line.clean_md5line(md5_line), reroot_dir
+        )
+
+    @staticmethod
+    def _split_cleaned_md5line(
+        cleaned_md5_line: str, reroot_dir: str = None
+    ) -> tuple[str, str]:
+        """same as `extract_filepath_and_checksum`, for a line already passed through `clean_md5line`"""
+        ## checksum is always 32 characters, so filepath (starting with "./") always starts at a fixed offset after it
+        checksum = cleaned_md5_line[:32]
+
+        # 'md5 -r' separates with a space, 'md5sum' with two characters ("  " in text mode, " *" in binary mode)
+        filepath_start = 34 if cleaned_md5_line[33:34] in (" ", "*") else 33
+
+        if (
+            cleaned_md5_line[32:33] != " "
+            or cleaned_md5_line[filepath_start : filepath_start + 2] != "./"
+            or not MD5Line.CHECKSUM_PATTERN.fullmatch(checksum)
+        ):
             raise ValueError("md5_line: format should be 'checksum filepath'")
 
-        filepath = f"./{MD5Line.clean_md5line(md5_line).split(' ./', 1)[1]}"
-        return utils.make_relative_path(filepath, reroot_dir)
+        return (
+            utils.make_relative_path(cleaned_md5_line[filepath_start:], reroot_dir),
+            checksum,
+        )
 
     @staticmethod
     def get_md5line_string(filepath: str, checksum: str) -> str:
@@ -1,5 +1,3 @@
-import re
-
 import utils
 from md5lines import MD5Line
 
@@ -12,6 +10,8 @@ class TeracopyMD5Line(MD5Line):
 
     """
 
+    __slots__ = ("_orig_teracopy_md5_line", "_teracopy_md5_line_reroot_dir")
+
     def __init__(self, teracopy_md5_line: str, reroot_dir: str = None) -> None:
         """
         Args:
@@ -25,17 +25,13 @@ class TeracopyMD5Line(MD5Line):
             ValueError: If `teracopy_md5_line` is not in expected format
 
         """
-        if not TeracopyMD5Line.validate_md5line(teracopy_md5_line):
-            raise ValueError("teracopy_md5_line: format should be 'checksum *filepath'")
-
         self._orig_teracopy_md5_line = MD5Line.clean_md5line(teracopy_md5_line)
         self._teracopy_md5_line_reroot_dir = reroot_dir
 
-        checksum = TeracopyMD5Line.extract_checksum(teracopy_md5_line)
-        filepath = TeracopyMD5Line.extract_filepath(teracopy_md5_line, reroot_dir)
-        md5_line = MD5Line.get_md5line_string(filepath, checksum)
-
-        super().__init__(md5_line, reroot_dir)
+        filepath, checksum = TeracopyMD5Line._split_cleaned_md5line(
+            self._orig_teracopy_md5_line, reroot_dir
+        )
+        self._set_md5line_fields(filepath, checksum, reroot_dir=reroot_dir)
 
     def get_string(self) -> str:
         return TeracopyMD5Line.get_teracopy_md5line_string(self.filepath, self.checksum)
@@ -54,7 +50,9 @@ class TeracopyMD5Line(MD5Line):
     def validate_md5line(md5_line: str) -> bool:
         """checks that `md5_line` is formatted correctly to be a teracopy_md5line"""
         ## only checks string contains a md5 checksum in the right place
-        if re.match("^[A-Fa-f0-9]{32}$", MD5Line.clean_md5line(md5_line).split(" *")[0]):
+        if MD5Line.CHECKSUM_PATTERN.fullmatch(
+            MD5Line.clean_md5line(md5_line).split(" *")[0]
+        ):
             return True
 
         return False
@@ -74,6 +72,27 @@ class TeracopyMD5Line(MD5Line):
         filepath = MD5Line.clean_md5line(teracopy_md5_line).split(" *", 1)[1]
         return utils.make_relative_path(filepath, reroot_dir)
 
+    @staticmethod
+    def extract_filepath_and_checksum(
+        teracopy_md5_line: str, reroot_dir: str = None
+    ) -> tuple[str, str]:
+        """same as `extract_filepath` and `extract_checksum`, but only parses `teracopy_md5_line` once"""
+        return TeracopyMD5Line._split_cleaned_md5line(
+            MD5Line.clean_md5line(teracopy_md5_line), reroot_dir
+        )
+
+    @staticmethod
+    def _split_cleaned_md5line(
+        cleaned_md5_line: str, reroot_dir: str = None
+    ) -> tuple[str, str]:
+        """same as `extract_filepath_and_checksum`, for a line already passed through `clean_md5line`"""
+        checksum, separator, filepath = cleaned_md5_line.partition(" *")
+
+        if not separator or not MD5Line.CHECKSUM_PATTERN.fullmatch(checksum):
+            raise ValueError("teracopy_md5_line: format should be 'checksum *filepath'")
+
+        return utils.make_relative_path(filepath, reroot_dir), checksum
+
     @staticmethod
     def get_teracopy_md5line_string(filepath: str, checksum: str) -> str:
         return f"{checksum} *{filepath}"
@@ -20,3 +20,11 @@ TEST122_LINE = "./1/2/test122.txt -> c4ca4238a0b923820dcc509a6f75849b\n"
 TEST21_LINE = "./2/test21.txt -> 3c59dc048e8850243be8079a5c74d079\n"
 TEST21_2_LINE = "./1/2/test21.txt -> 3c59dc048e8850243be8079a5c74d079\n"
 TEST11_2_LINE = "./1/2/test11.txt -> 3c59dc048e8850243be8079a5c74d079\n"  # wrong checksum
+
+# TEST*_LINEs as they appear in nested checksum files (short_format)
+TEST1_SHORT_LINE = f"{CustomMD5Line(TEST1_LINE).get_string(True)}\n"
+TEST2_SHORT_LINE = f"{CustomMD5Line(TEST2_LINE).get_string(True)}\n"
+TEST11_SHORT_LINE = f"{CustomMD5Line(TEST11_LINE).get_string(True)}\n"
+TEST121_SHORT_LINE = f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n"
+TEST122_SHORT_LINE = f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n"
+TEST21_SHORT_LINE = f"{CustomMD5Line(TEST21_LINE).get_string(True)}\n"
@@ -0,0 +1,92 @@
+from unittest import mock
+
+from tests import *
+
+CACHE_PATH = f"{TESTFILES_PATH}/cache/md5_cache.sqlite3"
+
+
+class TestChecksumCache(unittest.TestCase):
+    # for testing ChecksumCache and its use in md5_files and verify_checksums
+
+    def setUp(self):
+        # create folder structure and files to checksum
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+        os.makedirs(f"{TESTFILES_PATH}/1")
+
+        with open(f"{TESTFILES_PATH}/test1.txt", "w+", encoding="utf8") as file:
+            file.write("1")
+        with open(f"{TESTFILES_PATH}/1/test11.txt", "w+", encoding="utf8") as file:
+            file.write("11")
+
+        with open(MAIN_CHECKSUM_PATH, "w", encoding="utf8") as file:
+            file.write(HEADER_LINE)
+            file.write(TEST1_LINE)
+            file.write(TEST11_LINE)
+
+    def tearDown(self):
+        # delete created folder and contents
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+    def corrupt_test1_keeping_size_and_mtime(self):
+        stat = os.stat(f"{TESTFILES_PATH}/test1.txt")
+        with open(f"{TESTFILES_PATH}/test1.txt", "w", encoding="utf8") as file:
+            file.write("2")
+        os.utime(f"{TESTFILES_PATH}/test1.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def test_get_returns_none_when_not_cached(self):
+        filepath = f"{TESTFILES_PATH}/test1.txt"
+
+        with ChecksumCache(CACHE_PATH) as cache:
+            self.assertIsNone(cache.get(filepath, os.stat(filepath)))
+
+    def test_get_returns_checksum_until_file_changes(self):
+        filepath = f"{TESTFILES_PATH}/test1.txt"
+        checksum = CustomMD5Line.extract_checksum(TEST1_LINE)
+
+        with ChecksumCache(CACHE_PATH) as cache:
+            cache.set(filepath, os.stat(filepath), checksum)
+
+        with ChecksumCache(CACHE_PATH) as cache:
+            self.assertEqual(cache.get(filepath, os.stat(filepath)), checksum)
+
+            with open(filepath, "a", encoding="utf8") as file:
+                file.write("1")
+
+            self.assertIsNone(cache.get(filepath, os.stat(filepath)))
+
+    def test_md5_files_uses_cached_checksums(self):
+        filepaths = [f"{TESTFILES_PATH}/test1.txt", f"{TESTFILES_PATH}/1/test11.txt"]
+
+        with ChecksumCache(CACHE_PATH) as cache:
+            checksums = list(md5_files(filepaths, cache=cache))
+
+        self.corrupt_test1_keeping_size_and_mtime()
+
+        with ChecksumCache(CACHE_PATH) as cache:
+            self.assertEqual(list(md5_files(filepaths, cache=cache)), checksums)
+
+        self.assertNotEqual(list(md5_files(filepaths)), checksums)
+
+    def test_verify_with_cache_skips_unchanged_files(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": f"{TESTFILES_PATH}/cache"}):
+            passed, failed, _ = verify_checksums(
+                TESTFILES_PATH, verbose=False, use_cache=True
+            )
+            self.assertEqual(len(passed), 2)
+            self.assertEqual(len(failed), 0)
+            self.assertTrue(os.path.exists(get_default_cache_path()))
+
+            self.corrupt_test1_keeping_size_and_mtime()
+
+            passed, failed, _ = verify_checksums(
+                TESTFILES_PATH, verbose=False, use_cache=True
+            )
+            self.assertEqual(len(passed), 2)
+            self.assertEqual(len(failed), 0)
+
+            passed, failed, _ = verify_checksums(TESTFILES_PATH, verbose=False)
+            self.assertEqual(len(passed), 1)
+            self.assertEqual(len(failed), 1)
@@ -1,4 +1,8 @@
+import unicodedata
+from unittest import mock
+
 from tests import *
+from md5files import md5file_utils
 
 
 class TestChecksums(unittest.TestCase):
@@ -45,23 +49,51 @@ class TestChecksums(unittest.TestCase):
         self.assertFalse(os.path.exists(MAIN_CHECKSUM_PATH))
         self.assertFalse(os.path.exists(OLD_MAIN_CHECKSUM_PATH))
 
+    def get_dirs_with_nested_checksums(self):
+        return {
+            root.replace("\\", "/")
+            for root, _, files in os.walk(TESTFILES_PATH)
+            if NESTED_CHECKSUM_FILENAME in files
+        }
+
     def check_expected_main_checksum_contents(self):
         with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
-            lines = file.readlines()
-            self.assertEqual(len(lines), 7)
-            self.assertTrue(HEADER_LINE in lines)
-            self.assertTrue(TEST1_LINE in lines)
-            self.assertTrue(TEST2_LINE in lines)
-            self.assertTrue(TEST11_LINE in lines)
-            self.assertTrue(TEST121_LINE in lines)
-            self.assertTrue(TEST122_LINE in lines)
-            self.assertTrue(TEST21_LINE in lines)
+            # same lines (including any duplicates), in any order
+            self.assertCountEqual(
+                file.readlines(),
+                [
+                    HEADER_LINE,
+                    TEST1_LINE,
+                    TEST2_LINE,
+                    TEST11_LINE,
+                    TEST121_LINE,
+                    TEST122_LINE,
+                    TEST21_LINE,
+                ],
+            )
 
     def test_correct_checksums(self):
         generate_checksums(TESTFILES_PATH, False)
         self.assertTrue(os.path.isfile(MAIN_CHECKSUM_PATH))
         self.check_expected_main_checksum_contents()
 
+    def test_correct_checksums_with_processes(self):
+        # lower threshold so the small test directories use the process pool
+        with mock.patch.object(md5file_utils, "MD5_PROCESS_POOL_MIN_FILES", 1):
+            generate_checksums(TESTFILES_PATH, False, use_processes=True)
+            self.check_expected_main_checksum_contents()
+
+            passed, failed, new_files = verify_checksums(
+                TESTFILES_PATH, verbose=False, use_processes=True
+            )
+
+        self.assertEqual((len(passed), failed, new_files), (6, [], []))
+
+    def test_correct_checksums_with_trailing_slash(self):
+        generate_checksums(f"{TESTFILES_PATH}/", False)
+        self.assertTrue(os.path.isfile(MAIN_CHECKSUM_PATH))
+        self.check_expected_main_checksum_contents()
+
     def test_updates_file_when_updating_only(self):
         self.check_no_main_checksum_files()
 
@@ -81,6 +113,22 @@ class TestChecksums(unittest.TestCase):
 
         self.check_expected_main_checksum_contents()
 
+    def test_header_not_duplicated_after_byte_order_mark_when_updating_only(self):
+        generate_checksums(TESTFILES_PATH, False, files_to_ignore=["test21.txt"])
+
+        # rewrite checksum file with a byte order mark (e.g. saved by Notepad)
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            contents = file.read()
+        with open(MAIN_CHECKSUM_PATH, "w", encoding="utf-8-sig") as file:
+            file.write(contents)
+
+        generate_checksums(TESTFILES_PATH, True)
+
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf-8-sig") as file:
+            lines = file.readlines()
+        self.assertEqual(lines.count("; main_checksum\n"), 1)
+        self.assertTrue(TEST21_LINE in lines)
+
     def test_checksums_not_removed_when_updating_only(self):
         self.check_no_main_checksum_files()
 
@@ -145,34 +193,19 @@ class TestChecksums(unittest.TestCase):
     def test_create_nested_checksums(self):
         generate_checksums(TESTFILES_PATH, False)
 
-        self.assertFalse(os.path.exists(f"{TESTFILES_PATH}/{NESTED_CHECKSUM_FILENAME}"))
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/2/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/2/{NESTED_CHECKSUM_FILENAME}")
-        )
+        self.assertEqual(self.get_dirs_with_nested_checksums(), set())
 
         nest_checksums(TESTFILES_PATH, False)
 
-        self.assertTrue(os.path.exists(f"{TESTFILES_PATH}/{NESTED_CHECKSUM_FILENAME}"))
-        self.assertTrue(
-            os.path.exists(f"{TESTFILES_PATH}/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertTrue(
-            os.path.exists(f"{TESTFILES_PATH}/1/2/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertTrue(
-            os.path.exists(f"{TESTFILES_PATH}/2/{NESTED_CHECKSUM_FILENAME}")
+        # "1/1" has no files, so should not have a nested checksum file
+        self.assertEqual(
+            self.get_dirs_with_nested_checksums(),
+            {
+                TESTFILES_PATH,
+                f"{TESTFILES_PATH}/1",
+                f"{TESTFILES_PATH}/1/2",
+                f"{TESTFILES_PATH}/2",
+            },
         )
 
     def test_nested_checksums_contents_correct(self):
@@ -186,8 +219,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 3)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(f"{CustomMD5Line(TEST1_LINE).get_string(True)}\n" in lines)
-            self.assertTrue(f"{CustomMD5Line(TEST2_LINE).get_string(True)}\n" in lines)
+            self.assertTrue(TEST1_SHORT_LINE in lines)
+            self.assertTrue(TEST2_SHORT_LINE in lines)
 
         with open(
             f"{TESTFILES_PATH}/1/{NESTED_CHECKSUM_FILENAME}", "r", encoding="utf8"
@@ -195,7 +228,7 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 2)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(f"{CustomMD5Line(TEST11_LINE).get_string(True)}\n" in lines)
+            self.assertTrue(TEST11_SHORT_LINE in lines)
 
         with open(
             f"{TESTFILES_PATH}/1/2/{NESTED_CHECKSUM_FILENAME}", "r", encoding="utf8"
@@ -203,12 +236,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 3)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertTrue(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
         with open(
             f"{TESTFILES_PATH}/2/{NESTED_CHECKSUM_FILENAME}", "r", encoding="utf8"
@@ -216,7 +245,7 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 2)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(f"{CustomMD5Line(TEST21_LINE).get_string(True)}\n" in lines)
+            self.assertTrue(TEST21_SHORT_LINE in lines)
 
     def test_updates_nested_file_when_updating_only(self):
         generate_checksums(TESTFILES_PATH, False, files_to_ignore=["test121.txt"])
@@ -230,12 +259,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 2)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertFalse(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertFalse(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
         generate_checksums(TESTFILES_PATH, True)
         nest_checksums(TESTFILES_PATH, True)
@@ -248,12 +273,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 3)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertTrue(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
     def test_nested_checksums_not_removed_when_updating_only(self):
         generate_checksums(TESTFILES_PATH, False)
@@ -266,12 +287,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 3)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertTrue(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
         generate_checksums(TESTFILES_PATH, False, files_to_ignore=["test121.txt"])
         nest_checksums(TESTFILES_PATH, True)
@@ -283,12 +300,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 3)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertTrue(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
     def test_renames_old_nested_file_when_not_updating_only(self):
         generate_checksums(TESTFILES_PATH, False, files_to_ignore=["test121.txt"])
@@ -301,12 +314,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 2)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertFalse(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertFalse(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
         generate_checksums(TESTFILES_PATH, False)
         nest_checksums(TESTFILES_PATH, False)
@@ -318,12 +327,8 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 3)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertTrue(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertTrue(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
         with open(
             f"{TESTFILES_PATH}/1/2/{OLD_NESTED_FILENAME}", "r", encoding="utf8"
@@ -331,46 +336,27 @@ class TestChecksums(unittest.TestCase):
             lines = file.readlines()
             self.assertEqual(len(lines), 2)
             self.assertTrue(f"{NESTED_CHECKSUM_HEADER}\n" in lines)
-            self.assertFalse(
-                f"{CustomMD5Line(TEST121_LINE).get_string(True)}\n" in lines
-            )
-            self.assertTrue(
-                f"{CustomMD5Line(TEST122_LINE).get_string(True)}\n" in lines
-            )
+            self.assertFalse(TEST121_SHORT_LINE in lines)
+            self.assertTrue(TEST122_SHORT_LINE in lines)
 
     def test_delete_nested_checksums(self):
         generate_checksums(TESTFILES_PATH, False)
         nest_checksums(TESTFILES_PATH, False)
 
-        self.assertTrue(os.path.exists(f"{TESTFILES_PATH}/{NESTED_CHECKSUM_FILENAME}"))
-        self.assertTrue(
-            os.path.exists(f"{TESTFILES_PATH}/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertTrue(
-            os.path.exists(f"{TESTFILES_PATH}/1/2/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertTrue(
-            os.path.exists(f"{TESTFILES_PATH}/2/{NESTED_CHECKSUM_FILENAME}")
+        # "1/1" has no files, so should not have a nested checksum file
+        self.assertEqual(
+            self.get_dirs_with_nested_checksums(),
+            {
+                TESTFILES_PATH,
+                f"{TESTFILES_PATH}/1",
+                f"{TESTFILES_PATH}/1/2",
+                f"{TESTFILES_PATH}/2",
+            },
         )
 
         delete_nested_checksum_files(TESTFILES_PATH)
 
-        self.assertFalse(os.path.exists(f"{TESTFILES_PATH}/{NESTED_CHECKSUM_FILENAME}"))
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/1/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/1/2/{NESTED_CHECKSUM_FILENAME}")
-        )
-        self.assertFalse(
-            os.path.exists(f"{TESTFILES_PATH}/2/{NESTED_CHECKSUM_FILENAME}")
-        )
+        self.assertEqual(self.get_dirs_with_nested_checksums(), set())
 
 
 class TestChecksumsIndividual(unittest.TestCase):
@@ -429,6 +415,70 @@ class TestChecksumsIndividual(unittest.TestCase):
             self.assertTrue(TEST21_LINE in lines)
             self.assertTrue(TEST122_LINE in lines)
 
+    def test_new_files_written_in_natural_order_when_updating_only(self):
+        generate_checksums(TESTFILES_PATH, False)
+
+        for filename in ["test10.txt", "test3.txt"]:
+            with open(f"{TESTFILES_PATH}/{filename}", "w+", encoding="utf8") as file:
+                file.write("1")
+
+        generate_checksums(TESTFILES_PATH, True)
+
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            lines = [line.split(" -> ")[0] for line in file.readlines()]
+
+        self.assertEqual(lines[-2:], ["./test3.txt", "./test10.txt"])
+
+    def test_renames_old_file_to_lowest_unused_count(self):
+        old_path_template = os.path.splitext(OLD_MAIN_CHECKSUM_PATH)[0] + " ({}).txt"
+
+        generate_checksums(TESTFILES_PATH, False)
+        generate_checksums(TESTFILES_PATH, False)
+
+        # leave a gap at count 1, which should be filled before count 3
+        with open(old_path_template.format(2), "w", encoding="utf8") as file:
+            file.write(HEADER_LINE)
+
+        generate_checksums(TESTFILES_PATH, False)
+        self.assertTrue(os.path.isfile(old_path_template.format(1)))
+        self.assertFalse(os.path.exists(old_path_template.format(3)))
+
+        generate_checksums(TESTFILES_PATH, False)
+        self.assertTrue(os.path.isfile(old_path_template.format(3)))
+
+    def test_checksums_files_with_decomposed_filenames(self):
+        decomposed_filename = unicodedata.normalize("NFD", "tést.txt")
+        with open(
+            f"{TESTFILES_PATH}/{decomposed_filename}", "w+", encoding="utf8"
+        ) as file:
+            file.write("1")
+
+        generate_checksums(TESTFILES_PATH, False)
+
+        # lines use normalised (NFC) filenames
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            self.assertTrue(
+                TEST1_LINE.replace("test1.txt", "tést.txt") in file.readlines()
+            )
+
+        self.assertEqual(
+            verify_checksums(TESTFILES_PATH, verbose=False)[1],
+            [],
+        )
+
+    def test_skips_files_to_ignore_with_decomposed_filenames(self):
+        with open(f"{TESTFILES_PATH}/tést.txt", "w+", encoding="utf8") as file:
+            file.write("1")
+
+        generate_checksums(
+            TESTFILES_PATH,
+            False,
+            files_to_ignore=[unicodedata.normalize("NFD", "tést.txt")],
+        )
+
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            self.assertFalse(any("tést.txt" in line for line in file.readlines()))
+
     def test_skips_files_to_ignore_from_file(self):
         files_to_ignore_filepath = f"{TESTFILES_PATH}/files_to_ignore.txt"
 
@@ -452,7 +502,6 @@ class TestChecksumsIndividual(unittest.TestCase):
 
         with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
             lines = file.readlines()
-            print(lines)
             self.assertEqual(len(lines), 8)
             self.assertTrue(
                 "./files_to_ignore.txt -> dea79f1e304b900fb86f897a76083534\n" in lines
@@ -460,6 +509,27 @@ class TestChecksumsIndividual(unittest.TestCase):
             self.assertTrue(TEST1_LINE in lines)
             self.assertTrue(TEST122_LINE in lines)
 
+    def test_files_to_ignore_from_file_does_not_modify_list(self):
+        files_to_ignore_filepath = f"{TESTFILES_PATH}/files_to_ignore.txt"
+        files_to_ignore = ["test2.txt"]
+
+        with open(files_to_ignore_filepath, "w", encoding="utf8") as file:
+            file.write("files_to_ignore.txt\ntest1.txt")
+
+        generate_checksums(
+            TESTFILES_PATH,
+            False,
+            files_to_ignore=files_to_ignore,
+            files_to_ignore_filepath=files_to_ignore_filepath,
+        )
+        self.assertEqual(files_to_ignore, ["test2.txt"])
+
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            lines = file.readlines()
+            self.assertEqual(len(lines), 5)
+            self.assertFalse(TEST1_LINE in lines)
+            self.assertFalse(TEST2_LINE in lines)
+
     def test_remove_missing_checksums_without_save_orig(self):
         generate_checksums(TESTFILES_PATH, False)
         os.remove(f"{TESTFILES_PATH}/test1.txt")
@@ -479,6 +549,67 @@ class TestChecksumsIndividual(unittest.TestCase):
             self.assertTrue(HEADER_LINE in lines)
             self.assertFalse(TEST1_LINE in lines)
 
+    def test_finding_missing_files(self):
+        decomposed_filename = unicodedata.normalize("NFD", "tést.txt")
+        with open(
+            f"{TESTFILES_PATH}/{decomposed_filename}", "w+", encoding="utf8"
+        ) as file:
+            file.write("1")
+
+        generate_checksums(TESTFILES_PATH, False)
+        os.remove(f"{TESTFILES_PATH}/test1.txt")
+        shutil.rmtree(f"{TESTFILES_PATH}/1/2")
+
+        expected = ["./test1.txt", "./1/2/test121.txt", "./1/2/test122.txt"]
+        self.assertEqual(
+            finding_missing_files(TESTFILES_PATH, MAIN_CHECKSUM_PATH), expected
+        )
+        self.assertEqual(
+            finding_missing_files(TESTFILES_PATH, MAIN_CHECKSUM_PATH, max_workers=1),
+            expected,
+        )
+
+    def test_finding_missing_files_without_directory_part(self):
+        with open(MAIN_CHECKSUM_PATH, "w", encoding="utf8") as file:
+            file.write("; main_checksum\n")
+            file.write(f"test1.txt -> {'0' * 32}\n")
+            file.write(f"missing.txt -> {'0' * 32}\n")
+
+        expected = ["missing.txt"]
+        self.assertEqual(
+            finding_missing_files(TESTFILES_PATH, MAIN_CHECKSUM_PATH), expected
+        )
+
+        # existing file is found from the listing of `folder_path` alone
+        with mock.patch.object(md5file_utils.os.path, "exists", return_value=False):
+            self.assertEqual(
+                finding_missing_files(TESTFILES_PATH, MAIN_CHECKSUM_PATH), expected
+            )
+
+    def test_finding_missing_files_with_case_insensitive_names(self):
+        generate_checksums(TESTFILES_PATH, False)
+
+        # case-insensitive filesystem, where a file is listed in a different case to its checksum line
+        listdir = lambda dirpath: [name.upper() for name in os.listdir(dirpath)]
+
+        with mock.patch.object(md5file_utils, "_listdir_if_possible", listdir):
+            self.assertEqual(
+                finding_missing_files(TESTFILES_PATH, MAIN_CHECKSUM_PATH), []
+            )
+
+    def test_remove_missing_checksums_keeps_file_permissions(self):
+        generate_checksums(TESTFILES_PATH, False)
+        os.chmod(MAIN_CHECKSUM_PATH, 0o644)
+        os.remove(f"{TESTFILES_PATH}/test1.txt")
+
+        remove_missing_checksums(TESTFILES_PATH, False, False)
+        self.assertEqual(os.stat(MAIN_CHECKSUM_PATH).st_mode & 0o777, 0o644)
+
+        # no temporary files left behind
+        self.assertEqual(
+            [file for file in os.listdir(TESTFILES_PATH) if file.endswith(".tmp")], []
+        )
+
     def test_remove_missing_checksums_with_save_orig(self):
         generate_checksums(TESTFILES_PATH, False)
         os.remove(f"{TESTFILES_PATH}/test1.txt")
@@ -700,6 +831,16 @@ class TestVerifyingChecksums(unittest.TestCase):
         self.assertTrue(CustomMD5Line.extract_filepath(TEST122_LINE) in passed)
         self.assertTrue(CustomMD5Line.extract_filepath(TEST21_LINE) in passed)
 
+    def test_verify_with_trailing_slash_returns_correct_passed_failed_and_new(self):
+        passed, failed, new = verify_checksums(f"{TESTFILES_PATH}/", False, True, False)
+
+        self.assertEqual(len(passed), 4)
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(len(new), 1)
+
+        self.assertTrue(CustomMD5Line.extract_filepath(TEST11_LINE) in failed)
+        self.assertTrue(CustomMD5Line.extract_filepath(TEST121_LINE) in new)
+
     def test_verify_without_following_nested_dirs_returns_correct_passed_failed_and_new(
         self,
     ):
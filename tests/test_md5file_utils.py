@@ -1 +1,334 @@
+import hashlib
+import types
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 from tests import *
+from md5files import md5file_utils
+
+
+class TestMD5(unittest.TestCase):
+    # for testing md5 and md5_files
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # create files to checksum
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+        os.makedirs(TESTFILES_PATH)
+
+        with open(f"{TESTFILES_PATH}/test1.txt", "w+", encoding="utf8") as file:
+            file.write("1")
+        with open(f"{TESTFILES_PATH}/test2.txt", "w+", encoding="utf8") as file:
+            file.write("2")
+        with open(f"{TESTFILES_PATH}/medium.bin", "wb+") as file:
+            file.write(bytes(range(256)) * (MD5_READ_SIZE // 256 + 1))
+        with open(f"{TESTFILES_PATH}/large.bin", "wb+") as file:
+            file.write(bytes(range(256)) * (MD5_MMAP_SIZE // 256 + 1))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        # delete created folder and contents
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+    def check_md5_matches_hashlib(self, filepath: str):
+        with open(filepath, "rb") as file:
+            expected = hashlib.md5(file.read()).hexdigest()
+
+        self.assertEqual(md5(filepath), expected)
+
+    def test_md5_file_larger_than_read_size(self):
+        self.check_md5_matches_hashlib(f"{TESTFILES_PATH}/medium.bin")
+
+    def test_md5_file_larger_than_read_size_without_file_digest(self):
+        # hashlib without file_digest, as on Python versions before 3.11
+        old_hashlib = types.SimpleNamespace(md5=hashlib.md5)
+
+        with mock.patch.object(md5file_utils, "hashlib", old_hashlib):
+            self.check_md5_matches_hashlib(f"{TESTFILES_PATH}/medium.bin")
+
+    def test_read_buffer_reused_within_but_not_across_threads(self):
+        buffer = md5file_utils._get_read_buffer()
+        self.assertIs(md5file_utils._get_read_buffer(), buffer)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_buffer = executor.submit(md5file_utils._get_read_buffer).result()
+        self.assertIsNot(other_buffer, buffer)
+
+    def test_md5_file_larger_than_mmap_size(self):
+        self.check_md5_matches_hashlib(f"{TESTFILES_PATH}/large.bin")
+
+    def test_md5_file_larger_than_mmap_size_when_mmap_unsupported(self):
+        with mock.patch.object(
+            md5file_utils.mmap, "mmap", side_effect=OSError("mmap unsupported")
+        ):
+            self.check_md5_matches_hashlib(f"{TESTFILES_PATH}/large.bin")
+
+    def test_md5_file_larger_than_mmap_max_size(self):
+        with mock.patch.object(md5file_utils, "MD5_MMAP_MAX_SIZE", MD5_MMAP_SIZE):
+            self.check_md5_matches_hashlib(f"{TESTFILES_PATH}/large.bin")
+
+    @unittest.skipUnless(hasattr(os, "O_NOATIME"), "requires O_NOATIME")
+    def test_md5_does_not_update_access_time(self):
+        filepath = f"{TESTFILES_PATH}/test1.txt"
+        os.utime(filepath, (0, os.stat(filepath).st_mtime))
+
+        md5(filepath)
+        self.assertEqual(os.stat(filepath).st_atime, 0)
+
+    def test_md5_files_returns_checksums_in_order(self):
+        filepaths = [
+            f"{TESTFILES_PATH}/test2.txt",
+            f"{TESTFILES_PATH}/test1.txt",
+            f"{TESTFILES_PATH}/test2.txt",
+        ]
+
+        self.assertEqual(
+            list(md5_files(filepaths)),
+            [
+                CustomMD5Line.extract_checksum(TEST2_LINE),
+                CustomMD5Line.extract_checksum(TEST1_LINE),
+                CustomMD5Line.extract_checksum(TEST2_LINE),
+            ],
+        )
+
+    def test_md5_files_with_single_worker(self):
+        filepaths = [f"{TESTFILES_PATH}/test1.txt", f"{TESTFILES_PATH}/test2.txt"]
+
+        self.assertEqual(
+            list(md5_files(filepaths, max_workers=1)),
+            [md5(filepath) for filepath in filepaths],
+        )
+
+    def test_md5_files_with_single_file_does_not_start_pool(self):
+        filepath = f"{TESTFILES_PATH}/test1.txt"
+
+        with mock.patch.object(md5file_utils, "ThreadPoolExecutor") as executor:
+            self.assertEqual(list(md5_files([filepath])), [md5(filepath)])
+
+        executor.assert_not_called()
+
+    def test_md5_files_with_processes(self):
+        os.makedirs(f"{TESTFILES_PATH}/many")
+
+        filepaths = []
+        for i in range(MD5_PROCESS_POOL_MIN_FILES + 1):
+            filepaths.append(f"{TESTFILES_PATH}/many/{i}.txt")
+            with open(filepaths[-1], "w+", encoding="utf8") as file:
+                file.write(str(i))
+
+        self.assertEqual(
+            list(md5_files(filepaths, use_processes=True)),
+            [md5(filepath) for filepath in filepaths],
+        )
+
+    def test_md5_files_with_no_files(self):
+        self.assertEqual(list(md5_files([])), [])
+
+
+class TestSeparateByUniqueness(unittest.TestCase):
+    def test_separates_unique_and_non_unique_filenames(self):
+        filenames = ["a.txt", "b.txt", "a.txt", "c.txt", "a.txt"]
+        checksums = ["1", "2", "3", "4", "5"]
+
+        self.assertEqual(
+            md5file_utils.separate_by_uniqueness(filenames, checksums),
+            (
+                ["b.txt", "c.txt"],
+                ["2", "4"],
+                ["a.txt", "a.txt", "a.txt"],
+                ["1", "3", "5"],
+            ),
+        )
+
+
+class TestIterMD5File(unittest.TestCase):
+    # for testing iter_md5file and extract_from_md5file
+
+    def setUp(self) -> None:
+        os.makedirs(TESTFILES_PATH)
+
+        with open(f"{TESTFILES_PATH}/custom.txt", "w", encoding="utf8") as file:
+            file.writelines([HEADER_LINE, "\n", TEST1_LINE, TEST2_LINE])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(TESTFILES_PATH)
+
+    def test_yields_filepaths_and_checksums_in_order(self):
+        self.assertEqual(
+            list(iter_md5file(f"{TESTFILES_PATH}/custom.txt", "custom")),
+            [
+                (
+                    CustomMD5Line.extract_filepath(TEST1_LINE),
+                    CustomMD5Line.extract_checksum(TEST1_LINE),
+                ),
+                (
+                    CustomMD5Line.extract_filepath(TEST2_LINE),
+                    CustomMD5Line.extract_checksum(TEST2_LINE),
+                ),
+            ],
+        )
+
+    def test_extract_from_md5file_matches_iter_md5file(self):
+        filepath = f"{TESTFILES_PATH}/custom.txt"
+
+        self.assertEqual(
+            list(zip(*extract_from_md5file(filepath, "custom"))),
+            list(iter_md5file(filepath, "custom")),
+        )
+
+    def test_skips_byte_order_mark(self):
+        filepath = f"{TESTFILES_PATH}/md5.txt"
+        with open(filepath, "w", encoding="utf-8-sig") as file:
+            file.write("c4ca4238a0b923820dcc509a6f75849b ./test1.txt\n")
+
+        self.assertEqual(
+            list(iter_md5file(filepath, "md5")),
+            [("./test1.txt", "c4ca4238a0b923820dcc509a6f75849b")],
+        )
+
+    def test_does_not_skip_filepaths_starting_with_i_diaeresis(self):
+        filepath = f"{TESTFILES_PATH}/custom.txt"
+        with open(filepath, "a", encoding="utf8") as file:
+            file.write("ïtem.txt -> c4ca4238a0b923820dcc509a6f75849b\n")
+            # byte order mark decoded as Latin-1 and saved again is still skipped
+            file.write("ï»¿\n")
+
+        self.assertEqual(
+            list(iter_md5file(filepath, "custom"))[-1],
+            ("ïtem.txt", "c4ca4238a0b923820dcc509a6f75849b"),
+        )
+        self.assertEqual(len(list(iter_md5file(filepath, "custom"))), 3)
+
+    def test_skips_whitespace_only_lines(self):
+        filepath = f"{TESTFILES_PATH}/custom.txt"
+        with open(filepath, "a", encoding="utf8") as file:
+            file.write("  \n\t\n")
+
+        self.assertEqual(len(list(iter_md5file(filepath, "custom"))), 2)
+
+    def test_raises_before_iterating_when_header_missing(self):
+        with self.assertRaises(ValueError):
+            iter_md5file(f"{TESTFILES_PATH}/custom.txt", "custom_nested")
+
+
+class TestRemoveChecksums(unittest.TestCase):
+    def setUp(self) -> None:
+        os.makedirs(TESTFILES_PATH)
+
+        with open(MAIN_CHECKSUM_PATH, "w", encoding="utf8") as file:
+            file.writelines([HEADER_LINE, TEST1_LINE, TEST2_LINE])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(TESTFILES_PATH)
+
+    def test_removes_lines(self):
+        save_location, removed_lines = remove_checksums(
+            MAIN_CHECKSUM_PATH, ["./test1.txt"], False, False
+        )
+
+        self.assertEqual(removed_lines, [TEST1_LINE])
+        with open(save_location, "r", encoding="utf8") as file:
+            self.assertEqual(file.readlines(), [HEADER_LINE, TEST2_LINE])
+
+    def test_temporary_file_removed_if_replacing_fails(self):
+        with mock.patch.object(md5file_utils.os, "replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                remove_checksums(MAIN_CHECKSUM_PATH, ["./test1.txt"], False, False)
+
+        self.assertEqual(os.listdir(TESTFILES_PATH), [MAIN_CHECKSUM_FILENAME])
+
+
+class TestCheckCustomMD5FileHeader(unittest.TestCase):
+    def setUp(self) -> None:
+        os.makedirs(TESTFILES_PATH)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(TESTFILES_PATH)
+
+    def check_header(self, contents: bytes, nested: bool = False) -> bool:
+        filepath = f"{TESTFILES_PATH}/checksums.txt"
+        with open(filepath, "wb") as file:
+            file.write(contents)
+
+        return check_custom_md5file_header(filepath, nested)
+
+    def test_accepts_correct_header(self):
+        self.assertTrue(self.check_header(HEADER_LINE.encode()))
+        self.assertTrue(self.check_header(b"; nested_checksum\n", True))
+
+    def test_accepts_header_without_newline(self):
+        self.assertTrue(self.check_header(b"; main_checksum"))
+
+    def test_accepts_header_with_windows_newline(self):
+        self.assertTrue(self.check_header(b"; main_checksum\r\n"))
+
+    def test_accepts_header_after_byte_order_mark(self):
+        self.assertTrue(self.check_header(b"\xef\xbb\xbf; main_checksum\n"))
+
+    def test_rejects_other_header(self):
+        self.assertFalse(self.check_header(HEADER_LINE.encode(), True))
+        self.assertFalse(self.check_header(b"; main_checksum_old\n"))
+        self.assertFalse(self.check_header(b""))
+
+
+class TestIsChecksumFilename(unittest.TestCase):
+    def test_matches_checksum_filenames(self):
+        self.assertTrue(is_checksum_filename(MAIN_CHECKSUM_FILENAME))
+        self.assertTrue(is_checksum_filename(NESTED_CHECKSUM_FILENAME))
+        self.assertFalse(is_checksum_filename("test1.txt"))
+
+    def test_matches_old_checksum_filenames_only_when_incl_old(self):
+        self.assertFalse(is_checksum_filename(OLD_FILENAME))
+        self.assertTrue(is_checksum_filename(OLD_FILENAME, incl_old=True))
+        self.assertTrue(
+            is_checksum_filename(".nested_checksum_old (2).txt", incl_old=True)
+        )
+
+    def test_matches_only_checksum_type(self):
+        self.assertTrue(is_checksum_filename(MAIN_CHECKSUM_FILENAME, "custom"))
+        self.assertFalse(is_checksum_filename(NESTED_CHECKSUM_FILENAME, "custom"))
+        self.assertFalse(
+            is_checksum_filename(OLD_FILENAME, "custom_nested", incl_old=True)
+        )
+        self.assertTrue(
+            is_checksum_filename(OLD_NESTED_FILENAME, "custom_nested", incl_old=True)
+        )
+
+
+class TestSeparateByDirs(unittest.TestCase):
+    def test_separates_filepaths_by_parent_directory(self):
+        filepaths = ["./a/1.txt", "./b/1.txt", "./a/2.txt", "./a/1.txt"]
+        checksums = ["1", "2", "3", "1"]
+
+        self.assertEqual(
+            md5file_utils.separate_by_dirs(filepaths, checksums),
+            (["./a", "./b"], [["1.txt", "2.txt"], ["1.txt"]], [["1", "3"], ["2"]]),
+        )
+
+    def test_raises_on_identical_filepaths_with_different_checksums(self):
+        with self.assertRaises(ValueError):
+            md5file_utils.separate_by_dirs(["./a/1.txt", "./a/1.txt"], ["1", "2"])
+
+
+class TestExtractFromMD5Line(unittest.TestCase):
+    def test_extracts_filepath_and_checksum(self):
+        self.assertEqual(
+            extract_from_md5line(TEST1_LINE, "custom"),
+            (
+                CustomMD5Line.extract_filepath(TEST1_LINE),
+                CustomMD5Line.extract_checksum(TEST1_LINE),
+            ),
+        )
+
+    def test_format_type_is_case_insensitive(self):
+        self.assertEqual(
+            extract_from_md5line(TEST1_LINE, "CUSTOM"),
+            extract_from_md5line(TEST1_LINE, "custom"),
+        )
+
+    def test_raises_on_invalid_format_type(self):
+        with self.assertRaises(ValueError):
+            extract_from_md5line(TEST1_LINE, "sha1")
@@ -1 +1,107 @@
 from tests import *
+
+
+class TestCustomMD5Line(unittest.TestCase):
+    # for testing CustomMD5Line
+
+    def test_custom_md5line_string_format(self):
+        # generate_checksums writes lines in this format without calling CustomMD5Line
+        self.assertEqual(
+            CustomMD5Line.get_custom_md5line_string("./1/test11.txt", "abc") + "\n",
+            "./1/test11.txt -> abc\n",
+        )
+
+    def test_short_custom_md5line_string_format(self):
+        # nest_checksums writes lines in this format without calling CustomMD5Line
+        self.assertEqual(
+            CustomMD5Line.get_short_custom_md5line_string("./1/test11.txt", "abc")
+            + "\n",
+            "test11.txt -> abc\n",
+        )
+
+    def test_extract_filepath_and_checksum_matches_separate_extracts(self):
+        self.assertEqual(
+            CustomMD5Line.extract_filepath_and_checksum(TEST121_LINE),
+            (
+                CustomMD5Line.extract_filepath(TEST121_LINE),
+                CustomMD5Line.extract_checksum(TEST121_LINE),
+            ),
+        )
+
+    def test_extract_filepath_and_checksum_raises_on_invalid_line(self):
+        with self.assertRaises(ValueError):
+            CustomMD5Line.extract_filepath_and_checksum("./1/test11.txt abc\n")
+
+    def test_init_raises_on_line_without_separator(self):
+        with self.assertRaises(ValueError):
+            CustomMD5Line("./1/test11.txt 4c56ff4ce4aaf9573aa5dff913df997a\n")
+
+    def test_init_parses_filepath_and_checksum(self):
+        custom_md5line = CustomMD5Line(TEST121_LINE)
+
+        self.assertEqual(
+            (custom_md5line.filepath, custom_md5line.checksum),
+            CustomMD5Line.extract_filepath_and_checksum(TEST121_LINE),
+        )
+
+
+class TestMD5Line(unittest.TestCase):
+    # for testing MD5Line and TeracopyMD5Line
+
+    def test_extract_filepath_and_checksum_matches_separate_extracts(self):
+        md5_line = "4c56ff4ce4aaf9573aa5dff913df997a ./1/2/test121.txt\n"
+
+        self.assertEqual(
+            MD5Line.extract_filepath_and_checksum(md5_line),
+            (MD5Line.extract_filepath(md5_line), MD5Line.extract_checksum(md5_line)),
+        )
+
+    def test_extract_filepath_and_checksum_from_md5sum_output(self):
+        # 'md5sum' separates with two spaces (text mode) or " *" (binary mode)
+        expected = ("./1/2/test121.txt", "4c56ff4ce4aaf9573aa5dff913df997a")
+
+        self.assertEqual(
+            MD5Line.extract_filepath_and_checksum(
+                "4c56ff4ce4aaf9573aa5dff913df997a  ./1/2/test121.txt\n"
+            ),
+            expected,
+        )
+        self.assertEqual(
+            MD5Line.extract_filepath_and_checksum(
+                "4c56ff4ce4aaf9573aa5dff913df997a *./1/2/test121.txt\n"
+            ),
+            expected,
+        )
+
+    def test_teracopy_extract_filepath_and_checksum_matches_separate_extracts(self):
+        md5_line = "4c56ff4ce4aaf9573aa5dff913df997a *1\\2\\test121.txt\n"
+
+        self.assertEqual(
+            TeracopyMD5Line.extract_filepath_and_checksum(md5_line),
+            (
+                TeracopyMD5Line.extract_filepath(md5_line),
+                TeracopyMD5Line.extract_checksum(md5_line),
+            ),
+        )
+
+    def test_extract_filepath_and_checksum_raises_on_invalid_line(self):
+        with self.assertRaises(ValueError):
+            MD5Line.extract_filepath_and_checksum("abc ./1/test11.txt\n")
+        with self.assertRaises(ValueError):
+            MD5Line.extract_filepath_and_checksum(
+                "4c56ff4ce4aaf9573aa5dff913df997a extra ./1/test11.txt\n"
+            )
+        with self.assertRaises(ValueError):
+            TeracopyMD5Line.extract_filepath_and_checksum("abc *1/test11.txt\n")
+
+    def test_teracopy_init_does_not_reparse_as_md5line(self):
+        # filepaths in TeraCopy lines do not start with "./"
+        teracopy_md5line = TeracopyMD5Line(
+            "4c56ff4ce4aaf9573aa5dff913df997a *1\\2\\test121.txt\n"
+        )
+
+        self.assertEqual(teracopy_md5line.filepath, "1/2/test121.txt")
+        self.assertEqual(
+            teracopy_md5line.md5_line,
+            "4c56ff4ce4aaf9573aa5dff913df997a 1/2/test121.txt",
+        )
@@ -1 +1,176 @@
+import unicodedata
+from unittest import mock
+
 from tests import *
+from utils import (
+    clean_filepath,
+    get_dir_size,
+    get_dir_size_bytes,
+    make_relative_path,
+)
+
+
+class TestWalkFiles(unittest.TestCase):
+    # for testing walk_files and get_dir_size
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # create folder structure and files to walk
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+        os.makedirs(f"{TESTFILES_PATH}/1/1")
+        os.makedirs(f"{TESTFILES_PATH}/1/2")
+        os.makedirs(f"{TESTFILES_PATH}/2")
+
+        with open(f"{TESTFILES_PATH}/test1.txt", "w+", encoding="utf8") as file:
+            file.write("1")
+        with open(f"{TESTFILES_PATH}/1/test11.txt", "w+", encoding="utf8") as file:
+            file.write("11")
+        with open(f"{TESTFILES_PATH}/1/2/test121.txt", "w+", encoding="utf8") as file:
+            file.write("121")
+        with open(f"{TESTFILES_PATH}/1/2/test122.txt", "w+", encoding="utf8") as file:
+            file.write("1")
+
+        os.symlink(os.path.abspath(f"{TESTFILES_PATH}/1"), f"{TESTFILES_PATH}/2/link")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        # delete created folder and contents
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+    def test_walk_files_matches_os_walk(self):
+        expected = [(root, sorted(files)) for root, _, files in os.walk(TESTFILES_PATH)]
+        walked = [(root, sorted(files)) for root, files in walk_files(TESTFILES_PATH)]
+
+        self.assertEqual(walked, expected)
+
+    def test_walk_files_starts_at_top_directory(self):
+        root, files = next(walk_files(TESTFILES_PATH))
+
+        self.assertEqual(root, TESTFILES_PATH)
+        self.assertEqual(files, ["test1.txt"])
+
+    def test_walk_files_does_not_follow_symlinked_dirs(self):
+        walked = dict(walk_files(TESTFILES_PATH))
+
+        self.assertEqual(walked[f"{TESTFILES_PATH}/2"], [])
+        self.assertFalse(f"{TESTFILES_PATH}/2/link" in walked)
+
+    def test_get_dir_size_does_not_follow_symlinked_dirs(self):
+        # 7 bytes of files in total, not counting those under the symlink
+        self.assertEqual(
+            get_dir_size(TESTFILES_PATH, max_decimals=15), round(7 / 1024**3, 15)
+        )
+
+    def test_get_dir_size_bytes_is_exact(self):
+        self.assertEqual(get_dir_size_bytes(TESTFILES_PATH), 7)
+
+    def test_get_dir_size_bytes_skips_file_deleted_while_scanning(self):
+        # test1.txt (1 byte) is listed, but deleted before it is stat'ed
+        with mock.patch.object(
+            os, "scandir", _scandir_failing_stat("test1.txt", FileNotFoundError)
+        ):
+            self.assertEqual(get_dir_size_bytes(TESTFILES_PATH), 6)
+
+    def test_get_dir_size_bytes_raises_other_stat_errors(self):
+        with mock.patch.object(
+            os, "scandir", _scandir_failing_stat("test1.txt", PermissionError)
+        ):
+            with self.assertRaises(PermissionError):
+                get_dir_size_bytes(TESTFILES_PATH)
+
+
+def _scandir_failing_stat(filename: str, error: type):
+    """Returns a replacement for `os.scandir`, where stat() of `filename` raises `error`"""
+    real_scandir = os.scandir
+
+    class FailingStatEntry:
+        def __init__(self, entry):
+            self._entry = entry
+
+        def __getattr__(self, name):
+            return getattr(self._entry, name)
+
+        def stat(self, *args, **kwargs):
+            raise error(self._entry.path)
+
+    class Scandir:
+        # like the iterator returned by os.scandir, usable with and without `with`
+        def __init__(self, path):
+            self._entries = real_scandir(path)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_):
+            self._entries.close()
+
+        def __iter__(self):
+            for entry in self._entries:
+                yield FailingStatEntry(entry) if entry.name == filename else entry
+
+    return Scandir
+
+
+class TestAppendUniqueLinesToFile(unittest.TestCase):
+    # for testing append_unique_lines_to_file
+
+    def setUp(self):
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+        os.makedirs(TESTFILES_PATH)
+
+    def tearDown(self):
+        # delete created folder and contents
+        if os.path.exists(TESTFILES_PATH):
+            shutil.rmtree(TESTFILES_PATH)
+
+    def test_creates_file_if_missing(self):
+        append_unique_lines_to_file(MAIN_CHECKSUM_PATH, [HEADER_LINE, TEST1_LINE])
+
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            self.assertEqual(file.readlines(), [HEADER_LINE, TEST1_LINE])
+
+    def test_only_appends_new_lines(self):
+        append_unique_lines_to_file(MAIN_CHECKSUM_PATH, [HEADER_LINE, TEST1_LINE])
+        append_unique_lines_to_file(
+            MAIN_CHECKSUM_PATH, [TEST2_LINE, TEST1_LINE, TEST2_LINE, HEADER_LINE]
+        )
+
+        with open(MAIN_CHECKSUM_PATH, "r", encoding="utf8") as file:
+            self.assertEqual(file.readlines(), [HEADER_LINE, TEST1_LINE, TEST2_LINE])
+
+
+class TestNormaliseNFC(unittest.TestCase):
+    def test_ascii_string_returned_unchanged(self):
+        string = "./1/2/test121.txt"
+        self.assertIs(normalise_nfc(string), string)
+
+    def test_decomposed_string_composed(self):
+        self.assertEqual(
+            normalise_nfc(unicodedata.normalize("NFD", "./tést.txt")), "./tést.txt"
+        )
+
+
+class TestMakeRelativePath(unittest.TestCase):
+    def test_path_made_relative_to_root_dir(self):
+        self.assertEqual(make_relative_path("this/is/a/path", "is"), "./a/path")
+
+    def test_root_dir_only_matches_whole_dir_names(self):
+        # "is" is in "this", but is not a directory in the path
+        self.assertEqual(make_relative_path("this/a/path", "is"), "this/a/path")
+
+
+class TestCleanFilepath(unittest.TestCase):
+    def test_removes_trailing_slashes(self):
+        self.assertEqual(clean_filepath("a/b//"), "a/b")
+
+    def test_keeps_root(self):
+        self.assertEqual(clean_filepath("/"), "/")
+        self.assertEqual(clean_filepath("//"), "/")
+
+    def test_allow_trailing_slash(self):
+        self.assertEqual(clean_filepath("a\\b\\", True), "a/b/")
@@ -2,39 +2,108 @@
 
 Contains the following functions:
     * get_dir_size
+    * get_dir_size_bytes
     * clean_filepath
     * make_relative_path
     * concat_filepaths
     * append_unique_lines_to_file
+    * walk_files
 
 """
 
 import os
-import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 
+from utils.other import normalise_nfc
 
-def get_dir_size(dir_path: str, max_decimals: int = 3) -> float:
+
+def get_dir_size(
+    dir_path: str, max_decimals: int = 3, max_workers: int = None
+) -> float:
     """Gets filesize of a directory (all of its contents combined) in GiBs
 
     Args:
         dir_path (str): Path to directory to get filesize of.
         max_decimals (int, optional): Rounds filesize to max_decimals.
             Defaults to 3.
+        max_workers (int, optional): Maximum number of directories to scan at
+            the same time. If None, uses the `ThreadPoolExecutor` default.
+            Defaults to None.
 
     Returns:
         float: filesize of directory in gibibytes (GiB)
 
     """
-    total_filesize_bytes = 0
-
-    for root, _, files in os.walk(dir_path):
-        for file in files:
-            total_filesize_bytes += os.path.getsize(root + "/" + file)
+    total_filesize_bytes = get_dir_size_bytes(dir_path, max_workers)
 
     total_filesize_gigabytes = total_filesize_bytes / (1024**3)
     return round(total_filesize_gigabytes, max_decimals)
 
 
+def get_dir_size_bytes(dir_path: str, max_workers: int = None) -> int:
+    """Gets filesize of a directory (all of its contents combined) in bytes
+
+    Directories at the same depth are scanned concurrently, so that the
+    filesystem can serve many directory listings / stats at once.
+
+    Args:
+        dir_path (str): Path to directory to get filesize of.
+        max_workers (int, optional): Maximum number of directories to scan at
+            the same time. If None, uses the `ThreadPoolExecutor` default.
+            Defaults to None.
+
+    Returns:
+        int: exact filesize of directory in bytes
+
+    """
+    total_filesize_bytes = 0
+    dirs_to_scan = [dir_path]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while dirs_to_scan:
+            subdirs_to_scan = []
+
+            for filesize_bytes, subdirpaths in executor.map(
+                _scan_dir_size, dirs_to_scan
+            ):
+                total_filesize_bytes += filesize_bytes
+                subdirs_to_scan += subdirpaths
+
+            dirs_to_scan = subdirs_to_scan
+
+    return total_filesize_bytes
+
+
+def _scan_dir_size(dir_path: str) -> tuple[int, list]:
+    """Part of / Helper for `get_dir_size_bytes()`
+
+    Returns combined filesize (in bytes) of files directly in `dir_path`, and
+    paths to its subdirectories (not following symlinks). A directory that
+    cannot be read is skipped, same as `os.walk`, and so are files deleted
+    after being listed. Other errors getting a file's size are raised.
+
+    """
+    filesize_bytes, subdirpaths = 0, []
+
+    # scandir rather than walk + getsize, as DirEntry caches stat results where the OS provides them
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:  # directory cannot be read, skip (same as os.walk)
+        return 0, []
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirpaths.append(entry.path)
+            elif entry.is_file():
+                try:
+                    filesize_bytes += entry.stat().st_size
+                except FileNotFoundError:  # file deleted since it was listed
+                    continue
+
+    return filesize_bytes, subdirpaths
+
+
 def clean_filepath(filepath: str, allow_trailing_slash: bool = False) -> str:
     """Cleans filepath to return a filepath that follows local standard
 
@@ -53,8 +122,7 @@ def clean_filepath(filepath: str, allow_trailing_slash: bool = False) -> str:
     filepath = filepath.replace("\\", "/")
 
     if not allow_trailing_slash:
-        while filepath[-1] == "/":
-            filepath = filepath[:-1]
+        filepath = filepath.rstrip("/") or filepath[:1]  # keep root "/"
 
     return filepath
 
@@ -82,17 +150,20 @@ def make_relative_path(path: str, root_dir: str) -> str:
         str: `path` modified to be relative from `root_dir`
 
     """
-    path = unicodedata.normalize("NFC", path.replace("\\", "/"))
+    path = normalise_nfc(path.replace("\\", "/"))
 
     if root_dir is None:
         return path
 
-    root_dir = unicodedata.normalize("NFC", root_dir.replace("\\", "/"))
+    root_dir = normalise_nfc(root_dir.replace("\\", "/"))
 
-    if root_dir in path:
-        path = "/" + path + "/"
-        split_path = path.split(f"/{root_dir}/".replace("//", "/"), 1)
-        path = f"./{split_path[1][:-1]}"
+    # only match whole directory names, so pad both with "/"
+    padded_path = f"/{path}/"
+    root_dir_pattern = f"/{root_dir}/".replace("//", "/")
+    root_dir_index = padded_path.find(root_dir_pattern)
+
+    if root_dir_index != -1:
+        path = f"./{padded_path[root_dir_index + len(root_dir_pattern):-1]}"
 
     if path == "./":
         path = "."
@@ -128,7 +199,7 @@ def concat_filepaths(
 
     Returns:
         str: a filepath that is `second_path` joined onto `first_path`,
-            normalised to '\\' or '/' depending on platform being run on
+            always using '/' as the separator (even on Windows)
 
     """
     first_path = clean_filepath(first_path, True)
@@ -144,28 +215,68 @@ def concat_filepaths(
     elif second_path[:2] == "./":
         second_path = second_path[2:]
 
-    return os.path.join(first_path, second_path)
+    # both sides already use "/" and meet at exactly one slash, so no need for os.path.join
+    return first_path + second_path
 
 
 def append_unique_lines_to_file(filepath: str, lines: list) -> None:
     """Appends/writes lines to a file if they do not already exist in the file
 
     If the file specified by `filepath` does not exist, it will be created.
+    Duplicates within `lines` are only written once.
 
     Args:
         filepath (str): Path to file to append/write lines to.
         lines (list): List of lines (str) to be written.
 
     """
-    if not os.path.exists(filepath):
-        with open(filepath, "w+", encoding="utf8") as file:
-            for line in lines:
-                file.write(line)
-    else:
-        with open(filepath, "r", encoding="utf8") as file:
-            existing_lines = file.readlines()
-
-        with open(filepath, "a", encoding="utf8") as file:
-            for line in lines:
-                if line not in existing_lines:
-                    file.write(line)
+    # "a+" creates the file if needed, and allows reading it before appending
+    with open(filepath, "a+", encoding="utf8") as file:
+        file.seek(0)
+        existing_lines = set(file)
+
+        lines_to_write = []
+        for line in lines:
+            if line not in existing_lines:
+                existing_lines.add(line)
+                lines_to_write.append(line)
+
+        # one write of the joined lines, rather than writelines writing each line separately
+        file.write("".join(lines_to_write))
+
+
+def walk_files(dir_path: str):
+    """Walks a directory tree, yielding the filenames in each directory
+
+    Like `os.walk` (top-down, not following symlinks to directories), but
+    uses the file types cached by `os.scandir` and only collects filenames,
+    without building separate lists of subdirectories for the caller.
+
+    Args:
+        dir_path (str): Path to directory to walk.
+
+    Yields:
+        tuple[str, list]: path to a directory (starting with `dir_path`
+            itself) and list of filenames in that directory
+
+    """
+    dirpaths = [dir_path]
+
+    while dirpaths:
+        root = dirpaths.pop()
+        files, subdirpaths = [], []
+
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        files.append(entry.name)
+                    elif not entry.is_symlink():
+                        subdirpaths.append(entry.path)
+        except OSError:  # directory cannot be read, skip (same as os.walk)
+            continue
+
+        yield root, files
+
+        # visit subdirectories in the order they were found
+        dirpaths += reversed(subdirpaths)
@@ -1,10 +1,13 @@
-"""Miscellaneous Utilities 
+"""Miscellaneous Utilities
 
 Contains the following functions:
     * index_if_possible
+    * normalise_nfc
 
 """
 
+import unicodedata
+
 
 def index_if_possible(array: list, search_item) -> int:
     """
@@ -23,3 +26,22 @@ def index_if_possible(array: list, search_item) -> int:
         idx = -1
 
     return idx
+
+
+def normalise_nfc(string: str) -> str:
+    """Normalises `string` to Unicode NFC form
+
+    ASCII strings are always in NFC form, so they are returned as they are
+    without calling `unicodedata.normalize`.
+
+    Args:
+        string (str): String to normalise.
+
+    Returns:
+        str: `string` in NFC form
+
+    """
+    if string.isascii():
+        return string
+
+    return unicodedata.normalize("NFC", string)